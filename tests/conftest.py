@@ -8,16 +8,82 @@ Requirements: 5.1, 5.2, 5.3, 5.4, 5.5
 """
 
 import json
+import os
 from pathlib import Path
 from typing import Callable
 from unittest.mock import MagicMock
 
 import pytest
+from hypothesis import Phase, settings
 from typer.testing import CliRunner
 
 from vince.platform.base import OperationResult, Platform
 
 
+# =============================================================================
+# Hypothesis Profiles
+# =============================================================================
+
+# Select with HYPOTHESIS_PROFILE=smoke|dev|ci|nightly; unset keeps Hypothesis
+# defaults. "smoke" runs only explicit @example cases.
+settings.register_profile("smoke", phases=[Phase.explicit])
+settings.register_profile("dev", max_examples=10)
+settings.register_profile("ci", max_examples=100, deadline=None)
+settings.register_profile("nightly", max_examples=1000, deadline=None)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "default"))
+
+
+# =============================================================================
+# Documentation Fixtures
+# =============================================================================
+
+
+@pytest.fixture(scope="session")
+def docs_dir() -> Path:
+    """Provide the path to the project documentation directory.
+
+    Returns:
+        Path to the docs/ directory at the repository root.
+    """
+    return Path(__file__).parent.parent / "docs"
+
+
+# Documentation files read by the real-documentation tests.
+DOC_FILES = (
+    "tables.md",
+    "overview.md",
+    "examples.md",
+    "api.md",
+    "schemas.md",
+    "errors.md",
+    "states.md",
+    "config.md",
+)
+
+
+@pytest.fixture(scope="session")
+def docs_manifest(docs_dir: Path) -> dict[str, str | None]:
+    """Provide the text of each documentation file, read once per session.
+
+    The directory is listed with a single ``os.scandir`` pass instead of
+    probing each file with ``Path.exists()``. Values are plain strings so the
+    fixture is safe to use under ``pytest -n auto``, where each worker builds
+    its own copy.
+
+    Args:
+        docs_dir: Session-scoped documentation directory fixture.
+
+    Returns:
+        Mapping of each name in DOC_FILES to its content, or None when the
+        file is absent.
+    """
+    present = {entry.name for entry in os.scandir(docs_dir)} if docs_dir.is_dir() else set()
+    return {
+        name: (docs_dir / name).read_text() if name in present else None
+        for name in DOC_FILES
+    }
+
+
 # =============================================================================
 # Core Fixtures (Requirements: 5.1, 5.2, 5.3, 5.4)
 # =============================================================================
@@ -56,6 +122,24 @@ def mock_executable(tmp_path: Path) -> Path:
     return exe
 
 
+@pytest.fixture(scope="session")
+def isolated_tmp(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Provide a session directory named after the pytest-xdist worker.
+
+    Hypothesis-driven tests cannot use function-scoped tmp_path, so they
+    share this directory. The worker id keeps directories apart under
+    ``pytest -n auto``; without xdist the name uses ``main``.
+
+    Args:
+        tmp_path_factory: Pytest's session temporary directory factory.
+
+    Returns:
+        Path to an empty directory private to this worker.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    return tmp_path_factory.mktemp(f"v_{worker}")
+
+
 @pytest.fixture
 def isolated_data_dir(tmp_path: Path) -> Path:
     """Provide isolated data directory with empty JSON files.
@@ -226,10 +226,10 @@ class TestPatternUsageConsistency:
         as needing to be properly utilized.
         """
         critical_patterns = [
-            "return_type_pattern",
-            "exceptions_pattern",
-            "example_section_pattern",
-            "transition_section_pattern",
+            "_RETURN_TYPE_PATTERN",
+            "_EXCEPTIONS_PATTERN",
+            "_EXAMPLE_SECTION_PATTERN",
+            "_TRANSITION_SECTION_PATTERN",
         ]
         
         for pattern_name in critical_patterns:
@@ -111,7 +111,7 @@ def extract_extensions_from_source(extension_py_path: Path) -> set[str]:
     ext_pattern = re.compile(r'["\'](\.\w+)["\']')
     
     supported_match = re.search(
-        r'SUPPORTED_EXTENSIONS\s*=\s*\{([^}]+)\}',
+        r'SUPPORTED_EXTENSIONS\s*=\s*(?:frozenset\()?\{([^}]+)\}',
         content,
         re.DOTALL
     )
@@ -370,6 +370,42 @@ class TestValidationCoverageIntegration:
                     f"Missing file '{expected_file}' should generate a warning"
                 )
     
+    def test_parallel_validation_matches_sequential(
+        self,
+        docs_dir: Path,
+    ):
+        """
+        Test that validating with worker processes gives the same result.
+        
+        Per-file results are merged in file order, so errors, warnings
+        and validated files match a sequential run exactly.
+        """
+        from validate_docs import validate_all_docs
+        
+        if not docs_dir.exists():
+            pytest.skip("docs directory not found")
+        
+        sequential = validate_all_docs(docs_dir)
+        parallel = validate_all_docs(docs_dir, jobs=2)
+        
+        assert parallel.errors == sequential.errors
+        assert parallel.warnings == sequential.warnings
+        assert parallel.files_validated == sequential.files_validated
+
+    def test_validation_error_keeps_message_field(self):
+        """
+        Test that ValidationError takes message by keyword and that
+        add_error stores the message text as given.
+        """
+        from validate_docs import ValidationResult, ValidationError
+
+        plain = ValidationError(file="a.md", line=1, rule="2.1", message="Bad row")
+        assert plain.message == "Bad row"
+
+        result = ValidationResult()
+        result.add_error("a.md", 1, "2.1", "Bad row")
+        assert result.errors == [plain]
+
     def test_properties_checked_tracking(
         self,
         docs_dir: Path,
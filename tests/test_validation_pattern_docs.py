@@ -70,9 +70,9 @@ def extract_set_from_source(source_path: Path, set_name: str) -> set[str] | None
     
     content = source_path.read_text()
     
-    # Pattern to match: SET_NAME = {"item1", "item2", ...}
+    # Pattern to match: SET_NAME = {"item1", ...} or frozenset({...})
     pattern = re.compile(
-        rf'{set_name}\s*=\s*\{{([^}}]+)\}}',
+        rf'{set_name}\s*=\s*(?:frozenset\()?\{{([^}}]+)\}}',
         re.MULTILINE
     )
     
@@ -131,9 +131,9 @@ def extract_set_from_docs(docs_path: Path, set_name: str) -> set[str] | None:
     
     content = docs_path.read_text()
     
-    # Pattern to match: SET_NAME = {'item1', 'item2', ...}
+    # Pattern to match: SET_NAME = {'item1', ...} or frozenset({...})
     pattern = re.compile(
-        rf'{set_name}\s*=\s*\{{([^}}]+)\}}',
+        rf'{set_name}\s*=\s*(?:frozenset\()?\{{([^}}]+)\}}',
         re.MULTILINE
     )
     
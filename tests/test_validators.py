@@ -6,15 +6,25 @@ Each test validates a specific correctness property from the design document.
 """
 
 import sys
+from collections import defaultdict
 from pathlib import Path
 
 import pytest
-from hypothesis import given, settings
+from hypothesis import HealthCheck, given, settings
 from hypothesis import strategies as st
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# Shared settings for every property test in this module. The heavier
+# validators can exceed Hypothesis' default deadline on a loaded runner, which
+# triggers re-runs and shrinking for what is only a timing blip.
+FAST = settings(
+    max_examples=100,
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow, HealthCheck.filter_too_much],
+)
+
 from validate_docs import (extract_definitions_from_tables,
                            validate_code_blocks, validate_cross_references,
                            validate_entry_completeness,
@@ -23,6 +33,18 @@ from validate_docs import (extract_definitions_from_tables,
                            validate_rule_format, validate_sid_naming,
                            validate_table_syntax)
 
+
+def _bucket_errors(result, kind="errors"):
+    """Group a result's errors (or warnings) by rule number in a single pass.
+
+    Tests look up the bucket for the rule they exercise instead of scanning
+    every reported issue with a substring filter.
+    """
+    buckets = defaultdict(list)
+    for issue in getattr(result, kind):
+        buckets[issue.rule].append(issue)
+    return buckets
+
 # =============================================================================
 # Generators for Markdown Content
 # =============================================================================
@@ -130,15 +152,14 @@ def valid_table_content(draw):
     )
 
 
-@st.composite
-def invalid_table_content(draw):
-    """Generate markdown content with invalid table syntax (inconsistent columns)."""
-    header_row = "| col1 | col2 | col3 |"
-    separator = "| --- | --- | --- |"
-    # Row with wrong number of columns
-    bad_row = "| val1 | val2 |"
-
-    return f"# Table Doc\n\n## Section\n\n{header_row}\n{separator}\n{bad_row}"
+# Markdown content with invalid table syntax: the data row has too few columns.
+INVALID_TABLE_CONTENT = (
+    "# Table Doc\n\n## Section\n\n"
+    "| col1 | col2 | col3 |\n"
+    "| --- | --- | --- |\n"
+    "| val1 | val2 |"
+)
+invalid_table_content = st.just(INVALID_TABLE_CONTENT)
 
 
 @st.composite
@@ -184,14 +205,14 @@ class TestHeadingHierarchy:
     """Feature: documentation-population, Property 1: Heading hierarchy validation"""
 
     @given(content=valid_heading_content())
-    @settings(max_examples=100)
+    @FAST
     def test_valid_hierarchy_passes(self, content):
         """Valid heading hierarchy should produce no errors."""
         result = validate_heading_hierarchy(content, "test.md")
         assert result.is_valid, f"Valid hierarchy should pass: {result.errors}"
 
     @given(content=invalid_heading_content())
-    @settings(max_examples=100)
+    @FAST
     def test_h3_before_h2_fails(self, content):
         """H3 appearing before H2 should produce an error."""
         result = validate_heading_hierarchy(content, "test.md")
@@ -212,14 +233,14 @@ class TestTableSyntax:
     """Feature: documentation-population, Property 2: Table syntax validation"""
 
     @given(content=valid_table_content())
-    @settings(max_examples=100)
+    @FAST
     def test_valid_table_passes(self, content):
         """Valid table syntax should produce no errors."""
         result = validate_table_syntax(content, "test.md")
         assert result.is_valid, f"Valid table should pass: {result.errors}"
 
-    @given(content=invalid_table_content())
-    @settings(max_examples=100)
+    @given(content=invalid_table_content)
+    @FAST
     def test_inconsistent_columns_fails(self, content):
         """Tables with inconsistent column counts should produce errors."""
         result = validate_table_syntax(content, "test.md")
@@ -237,14 +258,14 @@ class TestCodeBlocks:
     """Feature: documentation-population, Property 3: Code block language identifiers"""
 
     @given(content=code_block_with_lang())
-    @settings(max_examples=100)
+    @FAST
     def test_code_block_with_lang_passes(self, content):
         """Code blocks with language identifiers should pass."""
         result = validate_code_blocks(content, "test.md")
         assert result.is_valid, f"Code block with lang should pass: {result.errors}"
 
     @given(content=code_block_without_lang())
-    @settings(max_examples=100)
+    @FAST
     def test_code_block_without_lang_fails(self, content):
         """Code blocks without language identifiers should fail."""
         result = validate_code_blocks(content, "test.md")
@@ -284,11 +305,8 @@ def complete_definitions_table(draw):
     return table
 
 
-@st.composite
-def incomplete_definitions_table(draw):
-    """Generate a DEFINITIONS table with missing fields."""
-    # Missing description field
-    return """# Tables
+# DEFINITIONS table with a missing description field.
+INCOMPLETE_DEFINITIONS_TABLE = """# Tables
 
 ## DEFINITIONS
 
@@ -296,24 +314,27 @@ def incomplete_definitions_table(draw):
 | --- | --- | --- | --- |
 | `item1` | i1 | i101 |  |
 """
+incomplete_definitions_table = st.just(INCOMPLETE_DEFINITIONS_TABLE)
 
 
 class TestEntryCompleteness:
     """Feature: documentation-population, Property 4: Entry field completeness"""
 
     @given(content=complete_definitions_table())
-    @settings(max_examples=100)
+    @FAST
     def test_complete_entries_pass(self, content):
         """Tables with all required fields should pass."""
         result = validate_entry_completeness(content, "tables.md")
         assert result.is_valid, f"Complete entries should pass: {result.errors}"
 
-    @given(content=incomplete_definitions_table())
-    @settings(max_examples=100)
+    @given(content=incomplete_definitions_table)
+    @FAST
     def test_incomplete_entries_fail(self, content):
         """Tables with missing fields should fail."""
         result = validate_entry_completeness(content, "tables.md")
-        empty_errors = [e for e in result.errors if "Empty field" in e.message]
+        empty_errors = [
+            e for e in _bucket_errors(result)["2.1"] if "Empty field" in e.message
+        ]
         assert len(empty_errors) > 0, "Should detect empty fields"
 
 
@@ -345,10 +366,8 @@ def unique_sid_table(draw):
     )
 
 
-@st.composite
-def duplicate_sid_table(draw):
-    """Generate a table with duplicate SID values for different IDs."""
-    return """# Tables
+# Table with duplicate SID values for different IDs.
+DUPLICATE_SID_TABLE = """# Tables
 
 ## DEFINITIONS
 
@@ -357,25 +376,26 @@ def duplicate_sid_table(draw):
 | `item1` | dup | dup01 | First item |
 | `item2` | dup | dup02 | Second item with same sid |
 """
+duplicate_sid_table = st.just(DUPLICATE_SID_TABLE)
 
 
 class TestSidNaming:
     """Feature: documentation-population, Property 5: SID naming convention compliance"""
 
     @given(content=unique_sid_table())
-    @settings(max_examples=100)
+    @FAST
     def test_unique_sids_pass(self, content):
         """Tables with unique SID values should pass."""
         result = validate_sid_naming(content, "tables.md")
         dup_errors = [e for e in result.errors if "Duplicate" in e.message]
         assert len(dup_errors) == 0, f"Unique sids should pass: {result.errors}"
 
-    @given(content=duplicate_sid_table())
-    @settings(max_examples=100)
+    @given(content=duplicate_sid_table)
+    @FAST
     def test_duplicate_sids_fail(self, content):
         """Tables with duplicate SID values for different IDs should fail."""
         result = validate_sid_naming(content, "tables.md")
-        dup_errors = [e for e in result.errors if "Duplicate" in e.message]
+        dup_errors = [e for e in _bucket_errors(result)["2.5"] if "Duplicate" in e.message]
         assert len(dup_errors) > 0, "Should detect duplicate sids"
 
 
@@ -385,12 +405,9 @@ class TestSidNaming:
 # =============================================================================
 
 
-class TestCrossReferences:
-    """Feature: documentation-population, Property 6: Cross-reference consistency"""
-
-    def test_defined_commands_pass(self):
-        """Commands that are defined in tables should pass cross-reference check."""
-        tables_content = """# Tables
+# COMMANDS table defining slap and chop, shared by the cross-reference and
+# example coverage tests.
+_TABLES_CMDS_FULL = """# Tables
 
 ## COMMANDS
 
@@ -399,15 +416,26 @@ class TestCrossReferences:
 | `slap` | sl | sl01 | Set default |
 | `chop` | ch | ch01 | Remove default |
 """
-        tables_defs = extract_definitions_from_tables(tables_content)
 
+
+@pytest.fixture(scope="module")
+def commands_defs():
+    """Definitions parsed from _TABLES_CMDS_FULL, extracted once per module."""
+    return extract_definitions_from_tables(_TABLES_CMDS_FULL)
+
+
+class TestCrossReferences:
+    """Feature: documentation-population, Property 6: Cross-reference consistency"""
+
+    def test_defined_commands_pass(self, commands_defs):
+        """Commands that are defined in tables should pass cross-reference check."""
         doc_content = """# Overview
 
 ## Commands
 
 Use `slap` to set defaults and `chop` to remove them.
 """
-        result = validate_cross_references(doc_content, "overview.md", tables_defs)
+        result = validate_cross_references(doc_content, "overview.md", commands_defs)
         assert result.is_valid, f"Defined commands should pass: {result.errors}"
 
     def test_undefined_commands_fail(self):
@@ -430,9 +458,18 @@ Use `slap` to set defaults and `chop` to remove them.
 Use `slap` and `chop` for operations.
 """
         result = validate_cross_references(doc_content, "overview.md", tables_defs)
-        cmd_errors = [e for e in result.errors if "chop" in e.message]
+        cmd_errors = [e for e in _bucket_errors(result)["5.1"] if "chop" in e.message]
         assert len(cmd_errors) > 0, "Should detect undefined command"
 
+    def test_cached_definitions_are_not_shared_mutably(self):
+        """Repeated extraction reuses the parse but hands out independent dicts."""
+        first = extract_definitions_from_tables(_TABLES_CMDS_FULL)
+        first["commands"] = frozenset()
+
+        second = extract_definitions_from_tables(_TABLES_CMDS_FULL)
+        assert second["commands"] == {"slap", "chop"}
+        assert isinstance(second["commands"], frozenset)
+
 
 # =============================================================================
 # Property 7: Flag Prefix Convention
@@ -440,10 +477,8 @@ Use `slap` and `chop` for operations.
 # =============================================================================
 
 
-@st.composite
-def valid_flag_table(draw):
-    """Generate a flag table with correct prefixes."""
-    return """# Tables
+# Flag table with correct prefixes.
+VALID_FLAG_TABLE = """# Tables
 
 ## UTILITY_FLAGS
 
@@ -452,12 +487,11 @@ def valid_flag_table(draw):
 | `help` | he | -h | --help | Display help |
 | `version` | ve | -v | --version | Display version |
 """
+valid_flag_table = st.just(VALID_FLAG_TABLE)
 
 
-@st.composite
-def invalid_flag_table(draw):
-    """Generate a flag table with incorrect prefixes."""
-    return """# Tables
+# Flag table with incorrect prefixes.
+INVALID_FLAG_TABLE = """# Tables
 
 ## UTILITY_FLAGS
 
@@ -465,20 +499,21 @@ def invalid_flag_table(draw):
 | --- | --- | --- | --- | --- |
 | `help` | he | --h | -help | Wrong prefixes |
 """
+invalid_flag_table = st.just(INVALID_FLAG_TABLE)
 
 
 class TestFlagPrefixes:
     """Feature: documentation-population, Property 7: Flag prefix convention"""
 
-    @given(content=valid_flag_table())
-    @settings(max_examples=100)
+    @given(content=valid_flag_table)
+    @FAST
     def test_valid_prefixes_pass(self, content):
         """Flags with correct prefixes should pass."""
         result = validate_flag_prefixes(content, "tables.md")
         assert result.is_valid, f"Valid prefixes should pass: {result.errors}"
 
-    @given(content=invalid_flag_table())
-    @settings(max_examples=100)
+    @given(content=invalid_flag_table)
+    @FAST
     def test_invalid_prefixes_fail(self, content):
         """Flags with incorrect prefixes should fail."""
         result = validate_flag_prefixes(content, "tables.md")
@@ -499,19 +534,8 @@ class TestFlagPrefixes:
 class TestExampleCoverage:
     """Feature: documentation-population, Property 8: Example completeness per command"""
 
-    def test_all_commands_have_examples(self):
+    def test_all_commands_have_examples(self, commands_defs):
         """All defined commands should have example sections."""
-        tables_content = """# Tables
-
-## COMMANDS
-
-| id | sid | rid | description |
-| --- | --- | --- | --- |
-| `slap` | sl | sl01 | Set default |
-| `chop` | ch | ch01 | Remove default |
-"""
-        tables_defs = extract_definitions_from_tables(tables_content)
-
         examples_content = """# Examples
 
 ## `slap`
@@ -526,24 +550,13 @@ vince slap app.exe --md
 vince chop --md
 ```
 """
-        result = validate_example_coverage(examples_content, "examples.md", tables_defs)
+        result = validate_example_coverage(examples_content, "examples.md", commands_defs)
         assert (
             result.is_valid
         ), f"All commands with examples should pass: {result.errors}"
 
-    def test_missing_command_examples_fail(self):
+    def test_missing_command_examples_fail(self, commands_defs):
         """Commands without example sections should fail."""
-        tables_content = """# Tables
-
-## COMMANDS
-
-| id | sid | rid | description |
-| --- | --- | --- | --- |
-| `slap` | sl | sl01 | Set default |
-| `chop` | ch | ch01 | Remove default |
-"""
-        tables_defs = extract_definitions_from_tables(tables_content)
-
         examples_content = """# Examples
 
 ## `slap`
@@ -552,8 +565,8 @@ vince chop --md
 vince slap app.exe --md
 ```
 """
-        result = validate_example_coverage(examples_content, "examples.md", tables_defs)
-        missing_errors = [e for e in result.errors if "chop" in e.message]
+        result = validate_example_coverage(examples_content, "examples.md", commands_defs)
+        missing_errors = [e for e in _bucket_errors(result)["7.1"] if "chop" in e.message]
         assert len(missing_errors) > 0, "Should detect missing command examples"
 
 
@@ -604,16 +617,17 @@ def examples_content_with_commands(draw, commands: list[str] | None = None):
     if commands is None:
         commands = draw(random_command_subset())
 
-    content = "# Examples\n\n## Overview\n\nUsage examples.\n\n"
-
-    for cmd in commands:
-        content += f"## `{cmd}`\n\n"
-        content += f"Description for {cmd}.\n\n"
-        content += "```sh\n"
-        content += f"vince {cmd} /path/to/app --md\n"
-        content += "```\n\n"
+    parts = ["# Examples\n\n## Overview\n\nUsage examples.\n\n"]
+    parts.extend(
+        f"## `{cmd}`\n\n"
+        f"Description for {cmd}.\n\n"
+        "```sh\n"
+        f"vince {cmd} /path/to/app --md\n"
+        "```\n\n"
+        for cmd in commands
+    )
 
-    return content, commands
+    return "".join(parts), commands
 
 
 class TestExampleCoverageProperty:
@@ -627,7 +641,7 @@ class TestExampleCoverageProperty:
     """
 
     @given(data=st.data())
-    @settings(max_examples=100)
+    @FAST
     def test_all_commands_have_examples_property(self, data):
         """
         Property 7.1: For any command in COMMANDS table, examples.md SHALL
@@ -667,7 +681,7 @@ class TestExampleCoverageProperty:
             assert result.is_valid, f"All commands present should pass: {result.errors}"
 
     @given(data=st.data())
-    @settings(max_examples=100)
+    @FAST
     def test_command_sections_have_code_blocks_property(self, data):
         """
         Property 7.2: For any command section in examples.md, it SHALL contain
@@ -708,21 +722,18 @@ class TestExampleCoverageProperty:
             code_errors = [e for e in result.errors if "no code examples" in e.message]
             assert len(code_errors) == len(commands), "Each section without code should fail"
 
-    def test_real_examples_md_coverage(self):
+    def test_real_examples_md_coverage(self, docs_manifest):
         """
         Integration test: Verify actual examples.md has all required coverage.
 
         Validates Requirements 7.1, 7.2, 7.4, 7.5 against real documentation.
         """
-        docs_dir = Path(__file__).parent.parent / "docs"
-        examples_path = docs_dir / "examples.md"
-        tables_path = docs_dir / "tables.md"
+        examples_content = docs_manifest["examples.md"]
+        tables_content = docs_manifest["tables.md"]
 
-        if not examples_path.exists() or not tables_path.exists():
+        if examples_content is None or tables_content is None:
             pytest.skip("Required documentation files not found")
 
-        examples_content = examples_path.read_text()
-        tables_content = tables_path.read_text()
         tables_defs = extract_definitions_from_tables(tables_content)
 
         # Validate example coverage
@@ -780,34 +791,36 @@ def valid_rule_references(draw):
         )
     )
 
-    content = "# Doc\n\n## Section\n\n"
-    for rule in rules:
-        content += f"See [{rule}] for details.\n"
+    parts = ["# Doc\n\n## Section\n\n"]
+    parts.extend(f"See [{rule}] for details.\n" for rule in rules)
+    return "".join(parts)
 
-    return content
 
-
-def invalid_rule_references():
-    """Generate content with invalid (lowercase) rule references."""
-    return st.just("# Doc\n\n## Section\n\nSee [pd01] for details.\n")
+# Content with invalid (lowercase) rule references.
+INVALID_RULE_REFERENCES = "# Doc\n\n## Section\n\nSee [pd01] for details.\n"
+invalid_rule_references = st.just(INVALID_RULE_REFERENCES)
 
 
 class TestRuleFormat:
     """Feature: documentation-population, Property 9: Rule reference format consistency"""
 
     @given(content=valid_rule_references())
-    @settings(max_examples=100)
+    @FAST
     def test_valid_rule_format_passes(self, content):
         """Valid rule references should pass."""
         result = validate_rule_format(content, "test.md")
         assert result.is_valid, f"Valid rule format should pass: {result.errors}"
 
-    @given(content=invalid_rule_references())
-    @settings(max_examples=100)
+    @given(content=invalid_rule_references)
+    @FAST
     def test_lowercase_rule_warns(self, content):
         """Lowercase rule references should produce warnings."""
         result = validate_rule_format(content, "test.md")
-        case_warnings = [w for w in result.warnings if "uppercase" in w.message.lower()]
+        case_warnings = [
+            w
+            for w in _bucket_errors(result, "warnings")["9.2"]
+            if "uppercase" in w.message.lower()
+        ]
         assert len(case_warnings) > 0, "Should warn about lowercase rule references"
 
 
@@ -830,44 +843,40 @@ def modular_command_content(draw):
         )
     )
 
-    content = "# Examples\n\n## Commands\n\n```sh\n"
-    for cmd in commands:
-        content += f"vince {cmd} --md\n"
-    content += "```"
+    body = "".join(f"vince {cmd} --md\n" for cmd in commands)
+    return f"# Examples\n\n## Commands\n\n```sh\n{body}```"
 
-    return content
 
-
-def underscore_command_content():
-    """Generate content with underscore-joined commands (violates PD01)."""
-    return st.just("""# Examples
+# Content with underscore-joined commands (violates PD01).
+UNDERSCORE_COMMAND_CONTENT = """# Examples
 
 ## Commands
 
 ```sh
 vince sub_command --md
 ```
-""")
+"""
+underscore_command_content = st.just(UNDERSCORE_COMMAND_CONTENT)
 
 
 class TestModularSyntax:
     """Feature: documentation-population, Property 10: Modular command syntax"""
 
     @given(content=modular_command_content())
-    @settings(max_examples=100)
+    @FAST
     def test_modular_syntax_passes(self, content):
         """Proper modular command syntax should pass."""
         result = validate_modular_syntax(content, "test.md")
         assert result.is_valid, f"Modular syntax should pass: {result.errors}"
 
-    @given(content=underscore_command_content())
-    @settings(max_examples=100)
+    @given(content=underscore_command_content)
+    @FAST
     def test_underscore_commands_fail(self, content):
         """Underscore-joined commands should fail."""
         result = validate_modular_syntax(content, "test.md")
         underscore_errors = [
             e
-            for e in result.errors
+            for e in _bucket_errors(result)["10.2"]
             if "underscore" in e.message.lower() or "PD01" in e.message
         ]
         assert len(underscore_errors) > 0, "Should detect underscore-joined commands"
@@ -881,47 +890,23 @@ class TestModularSyntax:
 class TestRealDocumentation:
     """Integration tests against actual documentation files."""
 
-    @pytest.fixture
-    def docs_dir(self):
-        return Path(__file__).parent.parent / "docs"
-
-    def test_tables_md_structure(self, docs_dir):
-        """tables.md should have valid structure."""
-        tables_path = docs_dir / "tables.md"
-        if not tables_path.exists():
-            pytest.skip("tables.md not found")
-
-        content = tables_path.read_text()
-
-        # Check heading hierarchy
-        result = validate_heading_hierarchy(content, "tables.md")
-        assert result.is_valid, f"tables.md heading hierarchy: {result.errors}"
-
-        # Check table syntax
-        result = validate_table_syntax(content, "tables.md")
-        assert result.is_valid, f"tables.md table syntax: {result.errors}"
-
-    def test_overview_md_structure(self, docs_dir):
-        """overview.md should have valid structure."""
-        overview_path = docs_dir / "overview.md"
-        if not overview_path.exists():
-            pytest.skip("overview.md not found")
-
-        content = overview_path.read_text()
-
-        result = validate_heading_hierarchy(content, "overview.md")
-        assert result.is_valid, f"overview.md heading hierarchy: {result.errors}"
-
-    def test_examples_md_structure(self, docs_dir):
-        """examples.md should have valid structure."""
-        examples_path = docs_dir / "examples.md"
-        if not examples_path.exists():
-            pytest.skip("examples.md not found")
-
-        content = examples_path.read_text()
+    @pytest.mark.parametrize(
+        "fname,validators",
+        [
+            ("tables.md", [validate_heading_hierarchy, validate_table_syntax]),
+            ("overview.md", [validate_heading_hierarchy]),
+            ("examples.md", [validate_heading_hierarchy]),
+        ],
+    )
+    def test_real_doc_structure(self, docs_manifest, fname, validators):
+        """Each documentation file should pass its structural validators."""
+        content = docs_manifest[fname]
+        if content is None:
+            pytest.skip(f"{fname} not found")
 
-        result = validate_heading_hierarchy(content, "examples.md")
-        assert result.is_valid, f"examples.md heading hierarchy: {result.errors}"
+        for validator in validators:
+            result = validator(content, fname)
+            assert result.is_valid, f"{fname} {validator.__name__}: {result.errors}"
 
 
 # =============================================================================
@@ -939,13 +924,8 @@ from validate_docs import (extract_config_options_from_tables,
                            validate_state_transitions)
 
 
-@st.composite
-def complete_api_command(draw):
-    """Generate API documentation for a command with all required elements."""
-    cmd = draw(
-        st.sampled_from(["slap", "chop", "set", "forget", "offer", "reject", "list"])
-    )
-
+def _mk_api(cmd):
+    """Build API documentation for a command with all required elements."""
     return f"""# API Documentation
 
 ## Command Interfaces
@@ -985,13 +965,8 @@ Returns `None`. Output is displayed via Rich console.
 """
 
 
-@st.composite
-def incomplete_api_command(draw):
-    """Generate API documentation missing required elements."""
-    cmd = draw(
-        st.sampled_from(["slap", "chop", "set", "forget", "offer", "reject", "list"])
-    )
-
+def _mk_incomplete_api(cmd):
+    """Build API documentation missing required elements."""
     # Missing function signature, parameters table, return type, or exceptions
     return f"""# API Documentation
 
@@ -1008,31 +983,30 @@ Some text but no function signature, parameter table, return type, or exceptions
 class TestAPICompleteness:
     """Feature: python-integration-preparation, Property 1: API Documentation Completeness"""
 
-    @given(content=complete_api_command())
-    @settings(max_examples=100)
-    def test_complete_api_passes(self, content):
+    @given(cmd=st.sampled_from(ALL_COMMANDS))
+    @settings(FAST, max_examples=10)
+    def test_complete_api_passes(self, cmd):
         """Complete API documentation should pass validation."""
-        result = validate_api_completeness(content, "api.md")
+        result = validate_api_completeness(_mk_api(cmd), "api.md")
         # Check that the documented command has no errors
         cmd_errors = [e for e in result.errors if "missing" in e.message.lower()]
         # We expect errors for the 6 other commands not documented
         assert len([e for e in cmd_errors if "is missing from API" in e.message]) == 6
 
-    @given(content=incomplete_api_command())
-    @settings(max_examples=100)
-    def test_incomplete_api_fails(self, content):
+    @given(cmd=st.sampled_from(ALL_COMMANDS))
+    @settings(FAST, max_examples=10)
+    def test_incomplete_api_fails(self, cmd):
         """Incomplete API documentation should fail validation."""
-        result = validate_api_completeness(content, "api.md")
+        result = validate_api_completeness(_mk_incomplete_api(cmd), "api.md")
         # Should have errors for missing elements
         assert len(result.errors) > 0, "Should detect missing API elements"
 
-    def test_real_api_md(self):
+    def test_real_api_md(self, docs_manifest):
         """Test against actual api.md file."""
-        api_path = Path(__file__).parent.parent / "docs" / "api.md"
-        if not api_path.exists():
+        content = docs_manifest["api.md"]
+        if content is None:
             pytest.skip("api.md not found")
 
-        content = api_path.read_text()
         result = validate_api_completeness(content, "api.md")
         assert result.is_valid, f"api.md should be complete: {result.errors}"
 
@@ -1044,11 +1018,12 @@ class TestAPICompleteness:
 # =============================================================================
 
 
-@st.composite
-def complete_schema_doc(draw):
-    """Generate schema documentation with all required elements."""
-    schema = draw(st.sampled_from(["defaults", "offers", "config"]))
+# Schemas documented in schemas.md
+ALL_SCHEMAS = ["defaults", "offers", "config"]
 
+
+def _mk_schema(schema):
+    """Build schema documentation with all required elements."""
     return f"""# Data Model Schemas
 
 ## {schema.title()} Schema
@@ -1087,11 +1062,8 @@ Description of the {schema} schema.
 """
 
 
-@st.composite
-def incomplete_schema_doc(draw):
-    """Generate schema documentation missing required elements."""
-    schema = draw(st.sampled_from(["defaults", "offers", "config"]))
-
+def _mk_incomplete_schema(schema):
+    """Build schema documentation missing required elements."""
     return f"""# Data Model Schemas
 
 ## {schema.title()} Schema
@@ -1103,31 +1075,30 @@ Description without proper schema definition or example.
 class TestSchemaCompleteness:
     """Feature: python-integration-preparation, Property 2: Schema Completeness"""
 
-    @given(content=complete_schema_doc())
-    @settings(max_examples=100)
-    def test_complete_schema_passes(self, content):
+    @given(schema=st.sampled_from(ALL_SCHEMAS))
+    @settings(FAST, max_examples=10)
+    def test_complete_schema_passes(self, schema):
         """Complete schema documentation should pass for documented schema."""
-        result = validate_schema_completeness(content, "schemas.md")
+        result = validate_schema_completeness(_mk_schema(schema), "schemas.md")
         # We expect errors for the 2 other schemas not documented
         missing_schema_errors = [
             e for e in result.errors if "is missing from schemas" in e.message
         ]
         assert len(missing_schema_errors) == 2
 
-    @given(content=incomplete_schema_doc())
-    @settings(max_examples=100)
-    def test_incomplete_schema_fails(self, content):
+    @given(schema=st.sampled_from(ALL_SCHEMAS))
+    @settings(FAST, max_examples=10)
+    def test_incomplete_schema_fails(self, schema):
         """Incomplete schema documentation should fail validation."""
-        result = validate_schema_completeness(content, "schemas.md")
+        result = validate_schema_completeness(_mk_incomplete_schema(schema), "schemas.md")
         assert len(result.errors) > 0, "Should detect missing schema elements"
 
-    def test_real_schemas_md(self):
+    def test_real_schemas_md(self, docs_manifest):
         """Test against actual schemas.md file."""
-        schemas_path = Path(__file__).parent.parent / "docs" / "schemas.md"
-        if not schemas_path.exists():
+        content = docs_manifest["schemas.md"]
+        if content is None:
             pytest.skip("schemas.md not found")
 
-        content = schemas_path.read_text()
         result = validate_schema_completeness(content, "schemas.md")
         assert result.is_valid, f"schemas.md should be complete: {result.errors}"
 
@@ -1139,21 +1110,23 @@ class TestSchemaCompleteness:
 # =============================================================================
 
 
-@st.composite
-def valid_error_entry(draw):
-    """Generate a valid error catalog entry."""
-    category = draw(st.sampled_from(["Input", "File", "State", "Config", "System", "OS"]))
-    category_ranges = {
+# Every (category, code) pair in the documented error ranges
+ERROR_CODE_CASES = [
+    (category, code_num)
+    for category, (min_val, max_val) in {
         "Input": (101, 105),
         "File": (201, 203),
         "State": (301, 304),
         "Config": (401, 402),
         "System": (501, 501),
         "OS": (601, 606),
-    }
-    min_val, max_val = category_ranges[category]
-    code_num = draw(st.integers(min_value=min_val, max_value=max_val))
+    }.items()
+    for code_num in range(min_val, max_val + 1)
+]
+
 
+def _mk_error_entry(category, code_num):
+    """Build a valid error catalog entry."""
     return f"""# Error Catalog
 
 ## Error Registry
@@ -1166,10 +1139,8 @@ def valid_error_entry(draw):
 """
 
 
-@st.composite
-def invalid_error_entry(draw):
-    """Generate an error catalog entry with invalid format."""
-    return """# Error Catalog
+# Error catalog entry with a code outside its category range.
+INVALID_ERROR_ENTRY = """# Error Catalog
 
 ## Error Registry
 
@@ -1179,16 +1150,17 @@ def invalid_error_entry(draw):
 | --- | --- | --- | --- |
 | VE999 | Invalid code outside range | error | Recovery |
 """
+invalid_error_entry = st.just(INVALID_ERROR_ENTRY)
 
 
 class TestErrorCatalog:
     """Feature: python-integration-preparation, Property 3: Error Catalog Completeness"""
 
-    @given(content=valid_error_entry())
-    @settings(max_examples=100)
-    def test_valid_error_passes(self, content):
+    @given(case=st.sampled_from(ERROR_CODE_CASES))
+    @settings(FAST, max_examples=len(ERROR_CODE_CASES))
+    def test_valid_error_passes(self, case):
         """Valid error entries should pass validation."""
-        result = validate_error_catalog(content, "errors.md")
+        result = validate_error_catalog(_mk_error_entry(*case), "errors.md")
         # Should have no format or range errors
         format_errors = [
             e
@@ -1197,25 +1169,24 @@ class TestErrorCatalog:
         ]
         assert len(format_errors) == 0, f"Valid errors should pass: {format_errors}"
 
-    @given(content=invalid_error_entry())
-    @settings(max_examples=100)
+    @given(content=invalid_error_entry)
+    @FAST
     def test_invalid_error_fails(self, content):
         """Invalid error entries should fail validation."""
         result = validate_error_catalog(content, "errors.md")
         range_errors = [
             e
-            for e in result.errors
+            for e in _bucket_errors(result)["3.5"]
             if "range" in e.message.lower() or "outside" in e.message.lower()
         ]
         assert len(range_errors) > 0, "Should detect out-of-range error codes"
 
-    def test_real_errors_md(self):
+    def test_real_errors_md(self, docs_manifest):
         """Test against actual errors.md file."""
-        errors_path = Path(__file__).parent.parent / "docs" / "errors.md"
-        if not errors_path.exists():
+        content = docs_manifest["errors.md"]
+        if content is None:
             pytest.skip("errors.md not found")
 
-        content = errors_path.read_text()
         result = validate_error_catalog(content, "errors.md")
         assert result.is_valid, f"errors.md should be complete: {result.errors}"
 
@@ -1227,12 +1198,8 @@ class TestErrorCatalog:
 # =============================================================================
 
 
-@st.composite
-def complete_transition_doc(draw):
-    """Generate state transition documentation with all required elements."""
-    from_state = draw(st.sampled_from(["none", "pending", "active", "removed"]))
-    to_state = draw(st.sampled_from(["pending", "active", "removed"]))
-
+def _mk_transition(from_state, to_state):
+    """Build state transition documentation with all required elements."""
     return f"""# State Machine Documentation
 
 ## Default Lifecycle
@@ -1245,10 +1212,8 @@ def complete_transition_doc(draw):
 """
 
 
-@st.composite
-def incomplete_transition_doc(draw):
-    """Generate state transition documentation missing required elements."""
-    return """# State Machine Documentation
+# State transition documentation missing required elements.
+INCOMPLETE_TRANSITION_DOC = """# State Machine Documentation
 
 ## Default Lifecycle
 
@@ -1258,33 +1223,39 @@ def incomplete_transition_doc(draw):
 | --- | --- | --- | --- | --- |
 | none | active | | | |
 """
+incomplete_transition_doc = st.just(INCOMPLETE_TRANSITION_DOC)
 
 
 class TestStateTransitions:
     """Feature: python-integration-preparation, Property 4: State Transition Completeness"""
 
-    @given(content=complete_transition_doc())
-    @settings(max_examples=100)
-    def test_complete_transition_passes(self, content):
+    @given(
+        from_state=st.sampled_from(["none", "pending", "active", "removed"]),
+        to_state=st.sampled_from(["pending", "active", "removed"]),
+    )
+    @settings(FAST, max_examples=12)
+    def test_complete_transition_passes(self, from_state, to_state):
         """Complete transition documentation should pass validation."""
-        result = validate_state_transitions(content, "states.md")
+        result = validate_state_transitions(_mk_transition(from_state, to_state), "states.md")
         assert result.is_valid, f"Complete transitions should pass: {result.errors}"
 
-    @given(content=incomplete_transition_doc())
-    @settings(max_examples=100)
+    @given(content=incomplete_transition_doc)
+    @FAST
     def test_incomplete_transition_fails(self, content):
         """Incomplete transition documentation should fail validation."""
         result = validate_state_transitions(content, "states.md")
-        missing_errors = [e for e in result.errors if "missing" in e.message.lower()]
+        buckets = _bucket_errors(result)
+        missing_errors = [
+            e for e in buckets["5.3"] + buckets["5.4"] if "missing" in e.message.lower()
+        ]
         assert len(missing_errors) > 0, "Should detect missing transition elements"
 
-    def test_real_states_md(self):
+    def test_real_states_md(self, docs_manifest):
         """Test against actual states.md file."""
-        states_path = Path(__file__).parent.parent / "docs" / "states.md"
-        if not states_path.exists():
+        content = docs_manifest["states.md"]
+        if content is None:
             pytest.skip("states.md not found")
 
-        content = states_path.read_text()
         result = validate_state_transitions(content, "states.md")
         assert result.is_valid, f"states.md should be complete: {result.errors}"
 
@@ -1296,12 +1267,9 @@ class TestStateTransitions:
 # =============================================================================
 
 
-class TestNewTableCrossReferences:
-    """Feature: python-integration-preparation, Property 6: Cross-Reference Completeness"""
-
-    def test_errors_in_tables(self):
-        """Error codes in errors.md should be in tables.md ERRORS table."""
-        tables_content = """# Tables
+# Synthetic tables.md / errors.md / states.md content for the cross-reference
+# scenarios below.
+XREF_ERRORS_TABLE = """# Tables
 
 ## ERRORS
 
@@ -1310,16 +1278,8 @@ class TestNewTableCrossReferences:
 | VE101 | ve101 | Input | Invalid path | error |
 | VE201 | ve201 | File | File not found | error |
 """
-        errors_content = "Error VE101 and VE201 are documented."
 
-        result = validate_new_table_cross_references(
-            errors_content, "", "", tables_content, "cross-refs"
-        )
-        assert result.is_valid, f"Matching errors should pass: {result.errors}"
-
-    def test_missing_errors_in_tables(self):
-        """Error codes not in tables.md should be flagged."""
-        tables_content = """# Tables
+XREF_SINGLE_ERROR_TABLE = """# Tables
 
 ## ERRORS
 
@@ -1327,17 +1287,8 @@ class TestNewTableCrossReferences:
 | --- | --- | --- | --- | --- |
 | VE101 | ve101 | Input | Invalid path | error |
 """
-        errors_content = "Error VE101 and VE999 are documented."
 
-        result = validate_new_table_cross_references(
-            errors_content, "", "", tables_content, "cross-refs"
-        )
-        missing_errors = [e for e in result.errors if "VE999" in e.message]
-        assert len(missing_errors) > 0, "Should detect missing error in tables"
-
-    def test_states_in_tables(self):
-        """State sids in states.md should be in tables.md STATES table."""
-        tables_content = """# Tables
+XREF_STATES_TABLE = """# Tables
 
 ## STATES
 
@@ -1346,30 +1297,59 @@ class TestNewTableCrossReferences:
 | none | def-none | default | No default exists |
 | active | def-actv | default | Default is active |
 """
-        states_content = "States def-none and def-actv are documented."
 
-        result = validate_new_table_cross_references(
-            "", states_content, "", tables_content, "cross-refs"
-        )
+
+@pytest.fixture(scope="class")
+def _xref_fixtures():
+    """Validate each synthetic cross-reference scenario once per class."""
+    return {
+        "errors_match": validate_new_table_cross_references(
+            "Error VE101 and VE201 are documented.",
+            "", "", XREF_ERRORS_TABLE, "cross-refs",
+        ),
+        "errors_missing": validate_new_table_cross_references(
+            "Error VE101 and VE999 are documented.",
+            "", "", XREF_SINGLE_ERROR_TABLE, "cross-refs",
+        ),
+        "states_match": validate_new_table_cross_references(
+            "", "States def-none and def-actv are documented.",
+            "", XREF_STATES_TABLE, "cross-refs",
+        ),
+    }
+
+
+class TestNewTableCrossReferences:
+    """Feature: python-integration-preparation, Property 6: Cross-Reference Completeness"""
+
+    def test_errors_in_tables(self, _xref_fixtures):
+        """Error codes in errors.md should be in tables.md ERRORS table."""
+        result = _xref_fixtures["errors_match"]
+        assert result.is_valid, f"Matching errors should pass: {result.errors}"
+
+    def test_missing_errors_in_tables(self, _xref_fixtures):
+        """Error codes not in tables.md should be flagged."""
+        missing_errors = [
+            e
+            for e in _bucket_errors(_xref_fixtures["errors_missing"])["10.2"]
+            if "VE999" in e.message
+        ]
+        assert len(missing_errors) > 0, "Should detect missing error in tables"
+
+    def test_states_in_tables(self, _xref_fixtures):
+        """State sids in states.md should be in tables.md STATES table."""
+        result = _xref_fixtures["states_match"]
         assert result.is_valid, f"Matching states should pass: {result.errors}"
 
-    def test_real_cross_references(self):
+    def test_real_cross_references(self, docs_manifest):
         """Test cross-references against actual documentation files."""
-        docs_dir = Path(__file__).parent.parent / "docs"
+        tables_content = docs_manifest["tables.md"]
+        errors_content = docs_manifest["errors.md"]
+        states_content = docs_manifest["states.md"]
+        config_content = docs_manifest["config.md"] or ""
 
-        tables_path = docs_dir / "tables.md"
-        errors_path = docs_dir / "errors.md"
-        states_path = docs_dir / "states.md"
-        config_path = docs_dir / "config.md"
-
-        if not all(p.exists() for p in [tables_path, errors_path, states_path]):
+        if tables_content is None or errors_content is None or states_content is None:
             pytest.skip("Required documentation files not found")
 
-        tables_content = tables_path.read_text()
-        errors_content = errors_path.read_text()
-        states_content = states_path.read_text()
-        config_content = config_path.read_text() if config_path.exists() else ""
-
         result = validate_new_table_cross_references(
             errors_content, states_content, config_content, tables_content, "cross-refs"
         )
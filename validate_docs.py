@@ -10,17 +10,109 @@ Usage:
     python validate_docs.py --file tables.md
     python validate_docs.py --cross-refs
     python validate_docs.py --report
+    python validate_docs.py --all --jobs 4
 """
 
 import argparse
 import re
 import sys
+from bisect import bisect_right
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
+from heapq import merge
+from itertools import accumulate, repeat
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional
 
+# =============================================================================
+# Validator Patterns
+# =============================================================================
 
-@dataclass
+# One line that is a ``` code fence (after optional indentation), an ATX
+# heading (hashes, whitespace, heading text) or a table row (starts and ends
+# with a pipe once surrounding whitespace is stripped). The three never match
+# the same line. [^\S\n] keeps each match on a single line when scanning a
+# whole document with re.MULTILINE.
+_STRUCTURE_PATTERN = re.compile(
+    r"^(?:[^\S\n]*(?P<fence>```)"
+    r"|(?P<hashes>#{1,6})[^\S\n]+(?P<text>.+)$"
+    r"|[^\S\n]*(?P<row>\|(?:.*\|)?)[^\S\n]*$)",
+    re.MULTILINE,
+)
+
+# A table separator row: pipe-delimited cells of dashes with optional colons.
+_SEPARATOR_PATTERN = re.compile(r"^\|(\s*[-:]+\s*\|)+$")
+
+# Command references like `slap`, `chop`, etc.
+_COMMAND_REF_PATTERN = re.compile(r"`(slap|chop|set|forget|offer|reject|list)`")
+
+# Command section headers in examples.md like ## `slap`
+_COMMAND_HEADING_PATTERN = re.compile(r"^##\s+`(\w+)`")
+
+# Rule references: valid rids (2-4 uppercase letters + 2 digits) match
+# "valid", potentially malformed lowercase ones match "malformed"
+_RULE_REF_PATTERN = re.compile(
+    r"\[(?:(?P<valid>[A-Z]{2,4}\d{2})|(?P<malformed>[a-z]{2,4}\d{2}))\]"
+)
+
+# Underscore-joined commands after 'vince', like: vince word_word
+_UNDERSCORE_CMD_PATTERN = re.compile(r"vince\s+(\w+_\w+)")
+_INLINE_UNDERSCORE_CMD_PATTERN = re.compile(r"`vince\s+(\w+_\w+)`")
+
+# Command sections and documentation elements in api.md, e.g. ### slap
+_COMMAND_SECTION_PATTERN = re.compile(r"^###\s+(\w+)\s*$")
+_SUBSECTION_PATTERN = re.compile(r"^####\s+(.+)\s*$")
+_CMD_FUNCTION_PATTERN = re.compile(r"def\s+cmd_(\w+)\s*\(")
+_PARAM_TABLE_HEADER_PATTERN = re.compile(r"\|\s*Parameter\s*\|")
+_RETURN_TYPE_PATTERN = re.compile(r"####\s+Return\s+Type")
+_EXCEPTIONS_PATTERN = re.compile(r"####\s+Raised\s+Exceptions")
+
+# Lines validate_api_completeness acts on: ``` fences, "###" and deeper
+# headings, cmd_* function signatures and "| Parameter |" table headers.
+# [^\S\n] keeps each match on a single line when scanning a whole document.
+_API_LINE_PATTERN = re.compile(
+    r"^(?=[^\S\n]*(?:```|###)"
+    r"|.*def[^\S\n]+cmd_"
+    r"|.*\|[^\S\n]*Parameter[^\S\n]*\|).*$",
+    re.MULTILINE,
+)
+
+# Schema and example sections in schemas.md
+_SCHEMA_SECTION_PATTERN = re.compile(r"^##\s+(\w+)\s+Schema", re.IGNORECASE)
+_EXAMPLE_SECTION_PATTERN = re.compile(r"^###\s+Example", re.IGNORECASE)
+
+# Quoted keys looked for in JSON schema blocks, one named group per feature.
+# The closing quote is a lookahead so keys sharing a quote, like
+# "type"required", are both found.
+_JSON_SCHEMA_KEY_PATTERN = re.compile(
+    r'"(?:(?P<schema>\$schema)|(?P<type>type)|(?P<required>required)'
+    r"|(?P<version>version)"
+    r'|(?P<constraint>pattern|enum|minimum|maximum|minLength|maxLength))(?=")'
+)
+
+# Error codes in errors.md, and category headers like "### Input Errors" or
+# "### OS Integration Errors"
+_ERROR_CODE_PATTERN = re.compile(r"^VE(\d{3})$")
+_ERROR_CODE_REF_PATTERN = re.compile(r"VE\d{3}")
+_ERROR_CATEGORY_PATTERN = re.compile(
+    r"^###\s+(\w+)(?:\s+\w+)?\s+Errors", re.IGNORECASE
+)
+
+# Lifecycle and transition sections in states.md, and state sids
+_ENTITY_SECTION_PATTERN = re.compile(r"^##\s+(\w+)\s+Lifecycle", re.IGNORECASE)
+_TRANSITION_SECTION_PATTERN = re.compile(
+    r"^###\s+(\w+)\s+State\s+Transitions", re.IGNORECASE
+)
+_STATE_SID_PATTERN = re.compile(r"(def-\w+|off-\w+)")
+
+# Config keys at the START of table rows (first column after |)
+_CONFIG_KEY_PATTERN = re.compile(r"^\|\s*`(\w+)`\s*\|", re.MULTILINE)
+
+
+@dataclass(slots=True, frozen=True)
 class ValidationError:
     """Represents a validation error."""
 
@@ -31,7 +123,7 @@ class ValidationError:
     severity: str = "error"  # error, warning
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Holds the results of validation."""
 
@@ -65,6 +157,239 @@ class ValidationResult:
         self.properties_checked.update(other.properties_checked)
 
 
+@dataclass(slots=True)
+class TableRow:
+    """A table row after the header, split into cells once."""
+
+    line: int
+    cells: tuple[str, ...]  # cell text stripped of whitespace
+    values: tuple[str, ...]  # cell text also stripped of backticks
+    is_separator: bool  # row contains "---"
+
+
+@dataclass(slots=True)
+class TableBlock:
+    """A markdown table outside code blocks, parsed once per document."""
+
+    section: Optional[str]  # text of the last "## " heading before the table
+    line: int  # line of the header row
+    headers: tuple[str, ...]  # header cells stripped of whitespace and backticks
+    rows: tuple[TableRow, ...]
+
+
+@dataclass(slots=True)
+class CodeBlock:
+    """A fenced code block, with its body joined once per document."""
+
+    line: int  # line of the opening fence
+    end_line: Optional[int]  # line of the closing fence, None if never closed
+    lang: str  # info string after the opening ```
+    text: str  # lines between the fences joined with "\n"
+
+
+@lru_cache(maxsize=8)
+def _tokenize(content: str) -> tuple[tuple[int, str, str, bool, bool], ...]:
+    """
+    Split content into line tokens once for all line-based validators.
+
+    Each token is (line_num, line, stripped, is_fence, in_code) with 1-based
+    line numbers. is_fence marks ``` lines; in_code is True for lines inside
+    a fenced block and, on a fence line, True when that fence closes a block.
+    Lines come from str.splitlines(), so CRLF and other line boundaries are
+    handled. The result is cached so validators run on the same document
+    share one split, strip and fence scan.
+    """
+    tokens = []
+    in_code_block = False
+    for line_num, line in enumerate(content.splitlines(), 1):
+        stripped = line.strip()
+        is_fence = stripped.startswith("```")
+        tokens.append((line_num, line, stripped, is_fence, in_code_block))
+        if is_fence:
+            in_code_block = not in_code_block
+    return tuple(tokens)
+
+
+@lru_cache(maxsize=8)
+def _line_starts(content: str) -> tuple[int, ...]:
+    """
+    Return the offset in content at which each line starts, followed by
+    len(content).
+
+    Lines follow the same str.splitlines() boundaries as _tokenize, so
+    bisect_right(_line_starts(content), offset) is the 1-based line number
+    of a match found by scanning the whole content. The offsets are summed
+    by accumulate() in C and kept as a tuple so the cached value is
+    immutable.
+    """
+    return tuple(accumulate(map(len, content.splitlines(keepends=True)), initial=0))
+
+
+@lru_cache(maxsize=8)
+def _prose_lines(content: str) -> tuple[tuple[int, str, str], ...]:
+    """
+    Return (line_num, line, stripped) for lines outside fenced code blocks.
+
+    Fence lines themselves are excluded, matching validators that toggle on
+    a fence and skip everything inside the block.
+    """
+    return tuple(
+        (line_num, line, stripped)
+        for line_num, line, stripped, is_fence, in_code in _tokenize(content)
+        if not is_fence and not in_code
+    )
+
+
+@lru_cache(maxsize=8)
+def _table_blocks(content: str) -> tuple[TableBlock, ...]:
+    """
+    Parse the tables outside fenced code blocks into TableBlocks.
+
+    A table starts at a line that begins and ends with "|" and ends at the
+    next line that does not begin with "|". Cells are split and stripped
+    once here, so validators that walk table rows share one parse.
+    """
+    blocks = []
+    section = None
+    header_line = 0
+    headers: tuple[str, ...] = ()
+    rows: Optional[list[TableRow]] = None
+
+    for line_num, _, stripped in _prose_lines(content):
+        if stripped.startswith("## "):
+            section = stripped[3:].strip()
+
+        if stripped.startswith("|") and stripped.endswith("|"):
+            # map() keeps the per-cell split and strip loops in C
+            cells = tuple(map(str.strip, stripped.split("|")[1:-1]))
+            values = tuple(map(str.strip, cells, repeat("`")))
+            if rows is None:
+                # Header row
+                header_line = line_num
+                headers = values
+                table_section = section
+                rows = []
+            else:
+                rows.append(TableRow(line_num, cells, values, "---" in stripped))
+        elif rows is not None and not stripped.startswith("|"):
+            # End of table
+            blocks.append(TableBlock(table_section, header_line, headers, tuple(rows)))
+            rows = None
+
+    if rows is not None:
+        blocks.append(TableBlock(table_section, header_line, headers, tuple(rows)))
+
+    return tuple(blocks)
+
+
+# Line boundaries str.splitlines() recognises other than "\n"
+_LINE_BREAKS = "\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+
+
+def _newline_text(content: str) -> str:
+    """
+    Return content with str.splitlines() boundaries as "\n" for whole-text
+    scans with re.MULTILINE.
+
+    Documents that only use "\n" are returned as-is, so the common case
+    scans the original string without copying it.
+    """
+    if not any(char in content for char in _LINE_BREAKS):
+        return content
+    return "\n".join(content.splitlines())
+
+
+@lru_cache(maxsize=8)
+def _scan_structure(
+    content: str,
+) -> tuple[tuple[tuple[int, int, str], ...], tuple[tuple[int, str], ...]]:
+    """
+    Find headings and table rows outside fenced code blocks in one pass.
+
+    Returns headings as (line_num, level, text) and table rows as
+    (line_num, stripped_row), both with 1-based line numbers in document
+    order. Only fence, heading and table lines match _STRUCTURE_PATTERN, so
+    prose is skipped inside the regex engine. The result is cached so the
+    heading and table validators share one scan of a document.
+    """
+    text = _newline_text(content)
+    headings = []
+    rows = []
+    in_code_block = False
+    line_num, line_start = 1, 0
+
+    for match in _STRUCTURE_PATTERN.finditer(text):
+        # Track code blocks to ignore headings and rows inside them
+        if match.group("fence"):
+            in_code_block = not in_code_block
+            continue
+
+        if in_code_block:
+            continue
+
+        line_num += text.count("\n", line_start, match.start())
+        line_start = match.start()
+        row = match.group("row")
+        if row is not None:
+            rows.append((line_num, row))
+        else:
+            headings.append(
+                (line_num, len(match.group("hashes")), match.group("text"))
+            )
+
+    return tuple(headings), tuple(rows)
+
+
+@lru_cache(maxsize=8)
+def _matching_lines(
+    content: str, pattern: re.Pattern
+) -> tuple[tuple[int, str], ...]:
+    """
+    Return (line_num, line) for the lines that pattern matches in full.
+
+    pattern is a re.MULTILINE pattern that matches a whole line, like
+    _API_LINE_PATTERN. The document is scanned once with finditer, so lines
+    a validator has no use for are skipped inside the regex engine and line
+    numbers are only counted for the lines that match. Line boundaries
+    follow str.splitlines(), as in _tokenize.
+    """
+    text = _newline_text(content)
+    lines = []
+    line_num, line_start = 1, 0
+    for match in pattern.finditer(text):
+        line_num += text.count("\n", line_start, match.start())
+        line_start = match.start()
+        lines.append((line_num, match.group()))
+    return tuple(lines)
+
+
+@lru_cache(maxsize=8)
+def _code_blocks(content: str) -> tuple[CodeBlock, ...]:
+    """
+    Return the fenced code blocks of a document in order.
+
+    Fence lines come from the shared _tokenize scan and are paired in order,
+    so a validator can take a block's body without tracking fence state and
+    collecting lines itself.
+    """
+    tokens = _tokenize(content)
+    fences = [token for token in tokens if token[3]]
+    blocks = []
+    for i in range(0, len(fences), 2):
+        line, _, stripped, _, _ = fences[i]
+        end_line = fences[i + 1][0] if i + 1 < len(fences) else None
+        body = tokens[line : end_line - 1 if end_line is not None else len(tokens)]
+        blocks.append(
+            CodeBlock(
+                line,
+                end_line,
+                stripped[3:].strip(),
+                "\n".join(token[1] for token in body),
+            )
+        )
+    return tuple(blocks)
+
+
 # =============================================================================
 # Property 1: Heading Hierarchy Validator
 # Validates: Requirements 1.1, 1.2
@@ -85,37 +410,27 @@ def validate_heading_hierarchy(content: str, filename: str) -> ValidationResult:
     established in the document flow.
     """
     result = ValidationResult()
-    lines = content.split("\n")
+    if "#" not in content:
+        # No heading can match without a hash
+        return result
+
+    add_error = result.add_error
+    add_warning = result.add_warning
 
     # Track state
     found_h1 = False
     found_h2_after_last_h1 = False
     current_h2_section: Optional[str] = None  # Track current H2 for context in errors
+    first_heading: Optional[tuple[int, int, str]] = None
 
-    # Pattern to match headings (not in code blocks)
-    heading_pattern = re.compile(r"^(#{1,6})\s+(.+)$")
-
-    in_code_block = False
-
-    for line_num, line in enumerate(lines, 1):
-        # Track code blocks to ignore headings inside them
-        if line.strip().startswith("```"):
-            in_code_block = not in_code_block
-            continue
-
-        if in_code_block:
-            continue
-
-        match = heading_pattern.match(line)
-        if not match:
-            continue
-
-        level = len(match.group(1))
-        heading_text = match.group(2)
+    # Headings inside code blocks are already excluded by the scan
+    for line_num, level, heading_text in _scan_structure(content)[0]:
+        if first_heading is None:
+            first_heading = (line_num, level, heading_text)
 
         if level == 1:
             if found_h1:
-                result.add_warning(
+                add_warning(
                     filename,
                     line_num,
                     "1.1",
@@ -126,7 +441,7 @@ def validate_heading_hierarchy(content: str, filename: str) -> ValidationResult:
 
         elif level == 2:
             if not found_h1:
-                result.add_error(
+                add_error(
                     filename,
                     line_num,
                     "1.1",
@@ -137,7 +452,7 @@ def validate_heading_hierarchy(content: str, filename: str) -> ValidationResult:
 
         elif level == 3:
             if not found_h1:
-                result.add_error(
+                add_error(
                     filename,
                     line_num,
                     "1.2",
@@ -149,7 +464,7 @@ def validate_heading_hierarchy(content: str, filename: str) -> ValidationResult:
                     if not current_h2_section
                     else f" (expected under '{current_h2_section}')"
                 )
-                result.add_error(
+                add_error(
                     filename,
                     line_num,
                     "1.2",
@@ -157,21 +472,8 @@ def validate_heading_hierarchy(content: str, filename: str) -> ValidationResult:
                 )
 
     # Check that document starts with H1
-    first_heading = None
-    in_code_block = False
-    for line_num, line in enumerate(lines, 1):
-        if line.strip().startswith("```"):
-            in_code_block = not in_code_block
-            continue
-        if in_code_block:
-            continue
-        match = heading_pattern.match(line)
-        if match:
-            first_heading = (line_num, len(match.group(1)), match.group(2))
-            break
-
     if first_heading and first_heading[1] != 1:
-        result.add_error(
+        add_error(
             filename,
             first_heading[0],
             "1.1",
@@ -201,38 +503,24 @@ def validate_table_syntax(content: str, filename: str) -> ValidationResult:
     pattern, and consistent column counts across all rows.
     """
     result = ValidationResult()
-    lines = content.split("\n")
+    if "|" not in content:
+        # Prose-only documents have no table rows to check
+        return result
 
-    in_code_block = False
     table_start = None
     table_lines = []
 
-    for line_num, line in enumerate(lines, 1):
-        # Track code blocks
-        if line.strip().startswith("```"):
-            in_code_block = not in_code_block
-            # If we were in a table, end it
-            if table_start is not None:
-                _validate_table_block(result, filename, table_start, table_lines)
-                table_start = None
-                table_lines = []
-            continue
-
-        if in_code_block:
-            continue
-
-        # Check if line is a table row
-        stripped = line.strip()
-        if stripped.startswith("|") and stripped.endswith("|"):
-            if table_start is None:
-                table_start = line_num
-            table_lines.append((line_num, stripped))
-        else:
-            # End of table
-            if table_start is not None:
-                _validate_table_block(result, filename, table_start, table_lines)
-                table_start = None
-                table_lines = []
+    # Rows inside code blocks are already excluded by the scan. Any other
+    # line between two rows (prose, heading, fence) ends the table, so a row
+    # continues the current table only when it directly follows the last one.
+    for line_num, row in _scan_structure(content)[1]:
+        if table_start is not None and line_num != table_lines[-1][0] + 1:
+            _validate_table_block(result, filename, table_start, table_lines)
+            table_start = None
+            table_lines = []
+        if table_start is None:
+            table_start = line_num
+        table_lines.append((line_num, row))
 
     # Handle table at end of file
     if table_start is not None:
@@ -241,6 +529,11 @@ def validate_table_syntax(content: str, filename: str) -> ValidationResult:
     return result
 
 
+def _count_pipe_columns(row: str) -> int:
+    """Count table columns as pipes minus 1 (leading and trailing pipes)."""
+    return row.count("|") - 1
+
+
 def _validate_table_block(
     result: ValidationResult,
     filename: str,
@@ -248,8 +541,9 @@ def _validate_table_block(
     table_lines: list[tuple[int, str]],
 ):
     """Validate a single table block."""
+    add_error = result.add_error
     if len(table_lines) < 2:
-        result.add_error(
+        add_error(
             filename,
             start_line,
             "1.3",
@@ -258,29 +552,22 @@ def _validate_table_block(
         return
 
     # Check for separator row (second row should be separator)
-    separator_pattern = re.compile(r"^\|(\s*[-:]+\s*\|)+$")
-
-    if len(table_lines) >= 2:
-        _, second_row = table_lines[1]
-        if not separator_pattern.match(second_row):
-            result.add_error(
-                filename,
-                table_lines[1][0],
-                "1.3",
-                f"Table separator row is malformed: '{second_row}'",
-            )
+    _, second_row = table_lines[1]
+    if not _SEPARATOR_PATTERN.match(second_row):
+        add_error(
+            filename,
+            table_lines[1][0],
+            "1.3",
+            f"Table separator row is malformed: '{second_row}'",
+        )
 
     # Check column consistency
-    def count_columns(row: str) -> int:
-        # Count pipes minus 1 (accounting for leading/trailing pipes)
-        return row.count("|") - 1
-
-    header_cols = count_columns(table_lines[0][1])
+    header_cols = _count_pipe_columns(table_lines[0][1])
 
     for line_num, row in table_lines[1:]:
-        row_cols = count_columns(row)
+        row_cols = _count_pipe_columns(row)
         if row_cols != header_cols:
-            result.add_error(
+            add_error(
                 filename,
                 line_num,
                 "1.3",
@@ -302,50 +589,32 @@ def validate_code_blocks(content: str, filename: str) -> ValidationResult:
     a language identifier immediately after the opening fence.
     """
     result = ValidationResult()
-    lines = content.split("\n")
-
-    code_fence_pattern = re.compile(r"^```(\w*)$")
 
-    for line_num, line in enumerate(lines, 1):
-        stripped = line.strip()
-        match = code_fence_pattern.match(stripped)
-        if match:
-            lang = match.group(1)
-            # Opening fence without language identifier
-            if stripped == "```":
-                # Check if this is a closing fence by looking at context
-                # We need to track if we're in a code block
-                pass
-
-    # Better approach: track code blocks properly
-    in_code_block = False
     code_block_start: Optional[int] = (
         None  # Track start line for unclosed block detection
     )
 
-    for line_num, line in enumerate(lines, 1):
-        stripped = line.strip()
-        if stripped.startswith("```"):
-            if not in_code_block:
-                # Opening fence
-                in_code_block = True
-                code_block_start = line_num
-                # Check for language identifier
-                lang = stripped[3:].strip()
-                if not lang:
-                    result.add_error(
-                        filename,
-                        line_num,
-                        "1.4",
-                        "Code block missing language identifier",
-                    )
-            else:
-                # Closing fence
-                in_code_block = False
-                code_block_start = None
+    for line_num, line, stripped, is_fence, in_code_block in _tokenize(content):
+        if not is_fence:
+            continue
+        if not in_code_block:
+            # Opening fence
+            code_block_start = line_num
+            # Check for language identifier
+            lang = stripped[3:].strip()
+            if not lang:
+                result.add_error(
+                    filename,
+                    line_num,
+                    "1.4",
+                    "Code block missing language identifier",
+                )
+        else:
+            # Closing fence
+            code_block_start = None
 
     # Check for unclosed code blocks
-    if in_code_block and code_block_start:
+    if code_block_start:
         result.add_error(
             filename,
             code_block_start,
@@ -362,6 +631,25 @@ def validate_code_blocks(content: str, filename: str) -> ValidationResult:
 # =============================================================================
 
 
+# Required fields for each table type, in the order they are reported
+_TABLE_SCHEMAS = {
+    "DEFINITIONS": ("id", "sid", "rid", "description"),
+    "COMMANDS": ("id", "sid", "rid", "description"),
+    "FILE_TYPES": ("id", "full_id", "ext", "sid", "flag_short", "flag_long"),
+    "UTILITY_FLAGS": ("id", "sid", "short", "long", "description"),
+    "QOL_FLAGS": ("id", "sid", "short", "description"),
+    "LIST_FLAGS": ("id", "sid", "short", "description"),
+    "OPERATORS": ("symbol", "name", "usage"),
+    "ARGUMENTS": ("pattern", "name", "description"),
+    "RULES": ("rid", "category", "description"),
+}
+
+# The same schemas as sets, so missing columns are one set difference
+_TABLE_SCHEMA_FIELDS = {
+    section: frozenset(fields) for section, fields in _TABLE_SCHEMAS.items()
+}
+
+
 def validate_entry_completeness(content: str, filename: str) -> ValidationResult:
     """
     Validate that all entries in definition tables have required fields.
@@ -372,88 +660,39 @@ def validate_entry_completeness(content: str, filename: str) -> ValidationResult
     """
     result = ValidationResult()
 
-    # Define required fields for each table type
-    table_schemas = {
-        "DEFINITIONS": ["id", "sid", "rid", "description"],
-        "COMMANDS": ["id", "sid", "rid", "description"],
-        "FILE_TYPES": ["id", "full_id", "ext", "sid", "flag_short", "flag_long"],
-        "UTILITY_FLAGS": ["id", "sid", "short", "long", "description"],
-        "QOL_FLAGS": ["id", "sid", "short", "description"],
-        "LIST_FLAGS": ["id", "sid", "short", "description"],
-        "OPERATORS": ["symbol", "name", "usage"],
-        "ARGUMENTS": ["pattern", "name", "description"],
-        "RULES": ["rid", "category", "description"],
-    }
-
-    lines = content.split("\n")
-    current_section = None
-    in_table = False
-    table_headers: list[str] = []
-    table_start_line: Optional[int] = None  # Track where table starts for error context
-
-    in_code_block = False
-
-    for line_num, line in enumerate(lines, 1):
-        stripped = line.strip()
-
-        # Track code blocks
-        if stripped.startswith("```"):
-            in_code_block = not in_code_block
+    for table in _table_blocks(content):
+        if table.section is None:
             continue
-
-        if in_code_block:
+        current_section = table.section.upper().replace(" ", "_")
+        if current_section not in _TABLE_SCHEMAS:
             continue
 
-        # Check for section headers
-        if stripped.startswith("## "):
-            section_name = stripped[3:].strip().upper().replace(" ", "_")
-            if section_name in table_schemas:
-                current_section = section_name
-                in_table = False
-                table_headers = []
-                table_start_line = None
-            else:
-                current_section = None
+        # Validate headers match schema
+        table_headers = table.headers
+        missing = _TABLE_SCHEMA_FIELDS[current_section].difference(table_headers)
+        if missing:
+            for req_field in _TABLE_SCHEMAS[current_section]:
+                if req_field in missing:
+                    result.add_error(
+                        filename,
+                        table.line,
+                        "2.1",
+                        f"Table {current_section} (starting line {table.line}) missing required column: {req_field}",
+                    )
 
-        # Parse table
-        if current_section and stripped.startswith("|") and stripped.endswith("|"):
-            if not in_table:
-                # This is the header row
-                in_table = True
-                table_start_line = line_num
-                # Parse headers
-                table_headers = [
-                    h.strip().strip("`") for h in stripped.split("|")[1:-1]
-                ]
-
-                # Validate headers match schema
-                required = table_schemas.get(current_section, [])
-                for req_field in required:
-                    if req_field not in table_headers:
-                        result.add_error(
-                            filename,
-                            line_num,
-                            "2.1",
-                            f"Table {current_section} (starting line {table_start_line}) missing required column: {req_field}",
-                        )
-            elif stripped.startswith("|") and "---" in stripped:
+        for row in table.rows:
+            if row.is_separator:
                 # Separator row, skip
                 continue
-            else:
-                # Data row - check for empty fields
-                cells = [c.strip() for c in stripped.split("|")[1:-1]]
-                for i, cell in enumerate(cells):
-                    if not cell and i < len(table_headers):
-                        result.add_error(
-                            filename,
-                            line_num,
-                            "2.1",
-                            f"Empty field '{table_headers[i]}' in {current_section} table",
-                        )
-        elif in_table and not stripped.startswith("|"):
-            # End of table
-            in_table = False
-            table_headers = []
+            # Data row - check for empty fields
+            for i, cell in enumerate(row.cells):
+                if not cell and i < len(table_headers):
+                    result.add_error(
+                        filename,
+                        row.line,
+                        "2.1",
+                        f"Empty field '{table_headers[i]}' in {current_section} table",
+                    )
 
     return result
 
@@ -464,6 +703,26 @@ def validate_entry_completeness(content: str, filename: str) -> ValidationResult
 # =============================================================================
 
 
+@lru_cache(maxsize=1024)
+def _expected_sid(id_clean: str) -> Optional[tuple[str, str, str]]:
+    """
+    Return (word form, expected sid, collision prefix) for an id, or None
+    when no naming convention applies.
+
+    - Two-word: first 2 letters of each word (e.g., short_id -> shid)
+    - One-word: first 2 letters (e.g., step -> st)
+    """
+    if "_" in id_clean:
+        parts = id_clean.split("_")
+        if len(parts) != 2:
+            return None
+        return "two-word", parts[0][:2] + parts[1][:2], parts[0][:2]
+    if len(id_clean) < 2:
+        return None
+    expected = id_clean[:2].lower()
+    return "one-word", expected, expected
+
+
 def validate_sid_naming(content: str, filename: str) -> ValidationResult:
     """
     Validate SID naming conventions.
@@ -480,68 +739,42 @@ def validate_sid_naming(content: str, filename: str) -> ValidationResult:
     """
     result = ValidationResult()
 
-    # Extract all sid values from tables
-    sid_occurrences: dict[str, list[tuple[int, str]]] = {}  # sid -> [(line, id)]
-
-    lines = content.split("\n")
-    in_code_block = False
-    in_table = False
-    table_headers: list[str] = []  # Track headers to know column positions
-    sid_col_idx = -1
-    id_col_idx = -1
-
-    for line_num, line in enumerate(lines, 1):
-        stripped = line.strip()
-
-        if stripped.startswith("```"):
-            in_code_block = not in_code_block
+    # Extract all sid values from tables, sid -> [(line, id)]
+    sid_occurrences: defaultdict[str, list[tuple[int, str]]] = defaultdict(list)
+
+    for table in _table_blocks(content):
+        # Column positions come from the header row
+        sid_col_idx = -1
+        id_col_idx = -1
+        for i, h in enumerate(table.headers):
+            if h.lower() == "sid":
+                sid_col_idx = i
+            if h.lower() == "id":
+                id_col_idx = i
+        if sid_col_idx < 0:
             continue
 
-        if in_code_block:
-            continue
-
-        if stripped.startswith("|") and stripped.endswith("|"):
-            cells = [c.strip().strip("`") for c in stripped.split("|")[1:-1]]
-
-            if not in_table:
-                # Header row
-                in_table = True
-                table_headers = cells
-                sid_col_idx = -1
-                id_col_idx = -1
-                for i, h in enumerate(table_headers):
-                    if h.lower() == "sid":
-                        sid_col_idx = i
-                    if h.lower() == "id":
-                        id_col_idx = i
-            elif "---" in stripped:
-                # Separator row
+        for row in table.rows:
+            if row.is_separator:
                 continue
-            else:
-                # Data row
-                if sid_col_idx >= 0 and sid_col_idx < len(cells):
-                    sid = cells[sid_col_idx]
-                    id_val = (
-                        cells[id_col_idx]
-                        if id_col_idx >= 0 and id_col_idx < len(cells)
-                        else ""
-                    )
-                    if sid:
-                        if sid not in sid_occurrences:
-                            sid_occurrences[sid] = []
-                        sid_occurrences[sid].append((line_num, id_val))
-        elif in_table and not stripped.startswith("|"):
-            in_table = False
-            table_headers = []
-            sid_col_idx = -1
-            id_col_idx = -1
+            # Data row
+            cells = row.values
+            if sid_col_idx < len(cells):
+                sid = cells[sid_col_idx]
+                id_val = (
+                    cells[id_col_idx]
+                    if id_col_idx >= 0 and id_col_idx < len(cells)
+                    else ""
+                )
+                if sid:
+                    sid_occurrences[sid].append((row.line, id_val))
 
     # Check for duplicates
     for sid, occurrences in sid_occurrences.items():
         if len(occurrences) > 1:
-            # Check if they're for different ids
-            unique_ids = set(occ[1] for occ in occurrences)
-            if len(unique_ids) > 1:
+            # Check if they're for different ids, stopping at the first mismatch
+            first_id = occurrences[0][1]
+            if any(occ[1] != first_id for occ in occurrences[1:]):
                 lines_str = ", ".join(str(occ[0]) for occ in occurrences)
                 result.add_error(
                     filename,
@@ -569,31 +802,23 @@ def validate_sid_naming(content: str, filename: str) -> ValidationResult:
                     # 2+ letter sids are acceptable - they're either standard or collision variants
                     continue
                 
-                if "_" in id_clean:
-                    # Two-word: should be first 2 letters of each word (e.g., short_id -> sid)
-                    parts = id_clean.split("_")
-                    if len(parts) == 2:
-                        expected = parts[0][:2] + parts[1][:2]
-                        # Check if sid matches expected or starts with first part (collision handling)
-                        if sid != expected and not sid.startswith(parts[0][:2]):
-                            result.add_warning(
-                                filename,
-                                line_num,
-                                "2.4",
-                                f"SID '{sid}' may not follow two-word convention for id '{id_val}' (expected '{expected}' or collision variant)",
-                            )
+                convention = _expected_sid(id_clean)
+                if convention is None:
+                    continue
+                word_form, expected, prefix = convention
+                if word_form == "two-word":
+                    # Check if sid matches expected or starts with first part (collision handling)
+                    mismatch = sid != expected and not sid.startswith(prefix)
                 else:
-                    # One-word: should be first 2 letters (e.g., step -> st)
-                    if len(id_clean) >= 2 and len(sid) >= 2:
-                        expected = id_clean[:2].lower()
-                        # Allow for collision handling (subsequent letters)
-                        if sid[:2].lower() != expected:
-                            result.add_warning(
-                                filename,
-                                line_num,
-                                "2.4",
-                                f"SID '{sid}' may not follow one-word convention for id '{id_val}' (expected '{expected}' or collision variant)",
-                            )
+                    # Allow for collision handling (subsequent letters)
+                    mismatch = len(sid) >= 2 and sid[:2].lower() != expected
+                if mismatch:
+                    result.add_warning(
+                        filename,
+                        line_num,
+                        "2.4",
+                        f"SID '{sid}' may not follow {word_form} convention for id '{id_val}' (expected '{expected}' or collision variant)",
+                    )
 
     return result
 
@@ -604,8 +829,20 @@ def validate_sid_naming(content: str, filename: str) -> ValidationResult:
 # =============================================================================
 
 
-def extract_definitions_from_tables(tables_content: str) -> dict[str, set[str]]:
-    """Extract all defined identifiers from tables.md."""
+def extract_definitions_from_tables(tables_content: str) -> dict[str, frozenset[str]]:
+    """
+    Extract all defined identifiers from tables.md.
+
+    The parse is cached per tables_content, so callers validating many files
+    against the same tables.md share it. Each call returns a fresh dict of
+    frozensets, so the cached parse cannot be modified through it.
+    """
+    return dict(_cached_definitions(tables_content))
+
+
+@lru_cache(maxsize=4)
+def _cached_definitions(tables_content: str) -> tuple[tuple[str, frozenset[str]], ...]:
+    """Parse tables.md definitions into (category, identifiers) pairs."""
     definitions = {
         "commands": set(),
         "sids": set(),
@@ -614,63 +851,48 @@ def extract_definitions_from_tables(tables_content: str) -> dict[str, set[str]]:
         "flags": set(),
     }
 
-    lines = tables_content.split("\n")
-    in_code_block = False
-    current_section = None
-    in_table = False
-    table_headers = []
-
-    for line in lines:
-        stripped = line.strip()
-
-        if stripped.startswith("```"):
-            in_code_block = not in_code_block
+    for table in _table_blocks(tables_content):
+        current_section = table.section.upper() if table.section is not None else None
+        # Resolve header names to column indices once per table, last column
+        # first, so a repeated header name resolves to its last column that
+        # the row actually has
+        col_idx: dict[str, list[int]] = {}
+        for i in range(len(table.headers) - 1, -1, -1):
+            col_idx.setdefault(table.headers[i].lower(), []).append(i)
+
+        # (column indices, definitions key, skip empty cells) per extracted column
+        columns = []
+        if "sid" in col_idx:
+            columns.append((col_idx["sid"], "sids", True))
+        if "id" in col_idx:
+            columns.append((col_idx["id"], "ids", True))
+        if current_section == "COMMANDS":
+            if "id" in col_idx:
+                columns.append((col_idx["id"], "commands", False))
+        elif current_section == "FILE_TYPES":
+            for name, key in (("ext", "extensions"), ("flag_short", "flags"), ("flag_long", "flags")):
+                if name in col_idx:
+                    columns.append((col_idx[name], key, False))
+        if not columns:
             continue
 
-        if in_code_block:
-            continue
-
-        if stripped.startswith("## "):
-            section = stripped[3:].strip().upper()
-            current_section = section
-            in_table = False
-            table_headers = []
-
-        if stripped.startswith("|") and stripped.endswith("|"):
-            cells = [c.strip().strip("`") for c in stripped.split("|")[1:-1]]
-
-            if not in_table:
-                in_table = True
-                table_headers = [h.lower() for h in cells]
-            elif "---" in stripped:
+        for row in table.rows:
+            if row.is_separator:
                 continue
-            else:
-                # Data row
-                cell_dict = dict(zip(table_headers, cells))
-
-                if "sid" in cell_dict and cell_dict["sid"]:
-                    definitions["sids"].add(cell_dict["sid"])
-                if "id" in cell_dict and cell_dict["id"]:
-                    definitions["ids"].add(cell_dict["id"])
-
-                if current_section == "COMMANDS":
-                    if "id" in cell_dict:
-                        definitions["commands"].add(cell_dict["id"])
-                elif current_section == "FILE_TYPES":
-                    if "ext" in cell_dict:
-                        definitions["extensions"].add(cell_dict["ext"])
-                    if "flag_short" in cell_dict:
-                        definitions["flags"].add(cell_dict["flag_short"])
-                    if "flag_long" in cell_dict:
-                        definitions["flags"].add(cell_dict["flag_long"])
-        elif in_table and not stripped.startswith("|"):
-            in_table = False
+            # Data row
+            values = row.values
+            for indices, key, skip_empty in columns:
+                for i in indices:
+                    if i < len(values):
+                        if values[i] or not skip_empty:
+                            definitions[key].add(values[i])
+                        break
 
-    return definitions
+    return tuple((key, frozenset(ids)) for key, ids in definitions.items())
 
 
 def validate_cross_references(
-    content: str, filename: str, tables_definitions: dict[str, set[str]]
+    content: str, filename: str, tables_definitions: dict[str, frozenset[str]]
 ) -> ValidationResult:
     """
     Validate cross-references between documents.
@@ -681,31 +903,27 @@ def validate_cross_references(
     """
     result = ValidationResult()
 
-    # Extract commands mentioned in the document
-    lines = content.split("\n")
-    in_code_block = False
+    tokens = _tokenize(content)
+    line_starts = _line_starts(content)
 
-    # Pattern to find command references like `slap`, `chop`, etc.
-    command_pattern = re.compile(r"`(slap|chop|set|forget|offer|reject|list)`")
+    # Scan the whole document once for command references; a reference never
+    # spans lines, so each match maps back to a single line
+    for match in _COMMAND_REF_PATTERN.finditer(content):
+        line_num = bisect_right(line_starts, match.start())
 
-    for line_num, line in enumerate(lines, 1):
-        if line.strip().startswith("```"):
-            in_code_block = not in_code_block
+        # Skip commands mentioned inside code blocks
+        _, _, _, is_fence, in_code_block = tokens[line_num - 1]
+        if is_fence or in_code_block:
             continue
 
-        if in_code_block:
-            continue
-
-        # Check for command references
-        for match in command_pattern.finditer(line):
-            cmd = match.group(1)
-            if cmd not in tables_definitions["commands"]:
-                result.add_error(
-                    filename,
-                    line_num,
-                    "5.1",
-                    f"Command '{cmd}' referenced but not defined in tables.md",
-                )
+        cmd = match.group(1)
+        if cmd not in tables_definitions["commands"]:
+            result.add_error(
+                filename,
+                line_num,
+                "5.1",
+                f"Command '{cmd}' referenced but not defined in tables.md",
+            )
 
     return result
 
@@ -729,72 +947,51 @@ def validate_flag_prefixes(content: str, filename: str) -> ValidationResult:
     """
     result = ValidationResult()
 
-    lines = content.split("\n")
-    in_code_block = False
-    in_table = False
-    table_headers = []
-    short_col_idx = -1
-    long_col_idx = -1
-
-    for line_num, line in enumerate(lines, 1):
-        stripped = line.strip()
-
-        if stripped.startswith("```"):
-            in_code_block = not in_code_block
+    for table in _table_blocks(content):
+        # Column positions come from the header row
+        short_col_idx = -1
+        long_col_idx = -1
+        for i, h in enumerate(table.headers):
+            h = h.lower()
+            if h == "short":
+                short_col_idx = i
+            if h == "long":
+                long_col_idx = i
+        if short_col_idx < 0 and long_col_idx < 0:
             continue
 
-        if in_code_block:
-            continue
-
-        if stripped.startswith("|") and stripped.endswith("|"):
-            cells = [c.strip().strip("`") for c in stripped.split("|")[1:-1]]
-
-            if not in_table:
-                in_table = True
-                table_headers = [h.lower() for h in cells]
-                short_col_idx = -1
-                long_col_idx = -1
-                for i, h in enumerate(table_headers):
-                    if h == "short":
-                        short_col_idx = i
-                    if h == "long":
-                        long_col_idx = i
-            elif "---" in stripped:
+        for row in table.rows:
+            if row.is_separator:
                 continue
-            else:
-                # Data row - validate flag prefixes
-                if short_col_idx >= 0 and short_col_idx < len(cells):
-                    short_flag = cells[short_col_idx]
-                    if short_flag and not short_flag.startswith("-"):
-                        result.add_error(
-                            filename,
-                            line_num,
-                            "4.5",
-                            f"Short flag '{short_flag}' should start with '-'",
-                        )
-                    # Short flags should NOT start with --
-                    if short_flag and short_flag.startswith("--"):
-                        result.add_error(
-                            filename,
-                            line_num,
-                            "4.5",
-                            f"Short flag '{short_flag}' should use single dash, not double",
-                        )
-
-                if long_col_idx >= 0 and long_col_idx < len(cells):
-                    long_flag = cells[long_col_idx]
-                    if long_flag and not long_flag.startswith("--"):
-                        result.add_error(
-                            filename,
-                            line_num,
-                            "4.5",
-                            f"Long flag '{long_flag}' should start with '--'",
-                        )
-        elif in_table and not stripped.startswith("|"):
-            in_table = False
-            table_headers = []
-            short_col_idx = -1
-            long_col_idx = -1
+            # Data row - validate flag prefixes
+            cells = row.values
+            if short_col_idx >= 0 and short_col_idx < len(cells):
+                short_flag = cells[short_col_idx]
+                if short_flag and not short_flag.startswith("-"):
+                    result.add_error(
+                        filename,
+                        row.line,
+                        "4.5",
+                        f"Short flag '{short_flag}' should start with '-'",
+                    )
+                # Short flags should NOT start with --
+                if short_flag and short_flag.startswith("--"):
+                    result.add_error(
+                        filename,
+                        row.line,
+                        "4.5",
+                        f"Short flag '{short_flag}' should use single dash, not double",
+                    )
+
+            if long_col_idx >= 0 and long_col_idx < len(cells):
+                long_flag = cells[long_col_idx]
+                if long_flag and not long_flag.startswith("--"):
+                    result.add_error(
+                        filename,
+                        row.line,
+                        "4.5",
+                        f"Long flag '{long_flag}' should start with '--'",
+                    )
 
     return result
 
@@ -806,7 +1003,7 @@ def validate_flag_prefixes(content: str, filename: str) -> ValidationResult:
 
 
 def validate_example_coverage(
-    examples_content: str, filename: str, tables_definitions: dict[str, set[str]]
+    examples_content: str, filename: str, tables_definitions: dict[str, frozenset[str]]
 ) -> ValidationResult:
     """
     Validate that all commands have examples.
@@ -819,21 +1016,8 @@ def validate_example_coverage(
     # Find all command sections in examples.md
     documented_commands = set()
 
-    lines = examples_content.split("\n")
-    in_code_block = False
-
-    # Pattern to match command section headers like ## `slap`
-    section_pattern = re.compile(r"^##\s+`(\w+)`")
-
-    for line_num, line in enumerate(lines, 1):
-        if line.strip().startswith("```"):
-            in_code_block = not in_code_block
-            continue
-
-        if in_code_block:
-            continue
-
-        match = section_pattern.match(line)
+    for _, line, _ in _prose_lines(examples_content):
+        match = _COMMAND_HEADING_PATTERN.match(line)
         if match:
             documented_commands.add(match.group(1))
 
@@ -854,10 +1038,8 @@ def validate_example_coverage(
     section_has_code = False
     section_start_line = None
 
-    for line_num, line in enumerate(lines, 1):
-        stripped = line.strip()
-
-        match = section_pattern.match(line)
+    for line_num, line, _, is_fence, _ in _tokenize(examples_content):
+        match = _COMMAND_HEADING_PATTERN.match(line)
         if match:
             # Check previous section
             if current_section and not section_has_code:
@@ -871,7 +1053,7 @@ def validate_example_coverage(
             section_has_code = False
             section_start_line = line_num
 
-        if stripped.startswith("```") and current_section:
+        if is_fence and current_section:
             section_has_code = True
 
     # Check last section
@@ -906,33 +1088,20 @@ def validate_rule_format(content: str, filename: str) -> ValidationResult:
     """
     result = ValidationResult()
 
-    lines = content.split("\n")
-    in_code_block = False
-
-    # Pattern for valid rid format (2-4 uppercase letters + 2 digits)
-    rid_pattern = re.compile(r"\[([A-Z]{2,4}\d{2})\]")
-
-    # Pattern for potentially malformed rule references (lowercase)
-    malformed_pattern = re.compile(r"\[([a-z]{2,4}\d{2})\]")
-
     # Track all valid rule references found
     valid_rule_refs: set[str] = set()
 
-    for line_num, line in enumerate(lines, 1):
-        if line.strip().startswith("```"):
-            in_code_block = not in_code_block
-            continue
-
-        if in_code_block:
-            continue
-
-        # Collect valid rule references
-        for match in rid_pattern.finditer(line):
-            valid_rule_refs.add(match.group(1))
+    # Code blocks are skipped by the shared line scan
+    for line_num, line, _ in _prose_lines(content):
+        for match in _RULE_REF_PATTERN.finditer(line):
+            # Collect valid rule references
+            rid = match.group("valid")
+            if rid:
+                valid_rule_refs.add(rid)
+                continue
 
-        # Check for malformed (lowercase) rule references
-        for match in malformed_pattern.finditer(line):
-            rid = match.group(1)
+            # Warn about malformed (lowercase) rule references
+            rid = match.group("malformed")
             result.add_warning(
                 filename,
                 line_num,
@@ -943,7 +1112,8 @@ def validate_rule_format(content: str, filename: str) -> ValidationResult:
     # Validate that rule references follow the expected format categories
     known_prefixes = {"PD", "UID", "TB", "SL", "CH", "SE", "FO", "OF", "RE", "LI"}
     for rid in valid_rule_refs:
-        prefix = "".join(c for c in rid if c.isalpha())
+        # _RULE_REF_PATTERN guarantees the rid ends in exactly two digits
+        prefix = rid[:-2]
         if prefix not in known_prefixes:
             result.add_warning(
                 filename,
@@ -975,50 +1145,33 @@ def validate_modular_syntax(content: str, filename: str) -> ValidationResult:
     """
     result = ValidationResult()
 
-    lines = content.split("\n")
-    in_code_block = False
-
-    # Pattern to detect underscore-joined commands after 'vince'
-    # This looks for patterns like: vince word_word
-    underscore_cmd_pattern = re.compile(r"vince\s+(\w+_\w+)")
-
-    for line_num, line in enumerate(lines, 1):
-        stripped = line.strip()
-
-        if stripped.startswith("```"):
-            in_code_block = not in_code_block
+    # One pass over the document: command examples in code blocks are checked
+    # for underscore commands, prose lines for underscore commands in inline
+    # code. Inline issues are reported after the code block ones.
+    inline_matches = []
+    for line_num, line, _, is_fence, in_code_block in _tokenize(content):
+        if is_fence:
             continue
-
-        # Only check inside code blocks (actual command examples)
         if in_code_block:
-            match = underscore_cmd_pattern.search(line)
+            match = _UNDERSCORE_CMD_PATTERN.search(line)
             if match:
-                bad_cmd = match.group(1)
                 result.add_error(
                     filename,
                     line_num,
                     "10.2",
-                    f"Underscore-joined command '{bad_cmd}' violates modular design [PD01]",
+                    f"Underscore-joined command '{match.group(1)}' violates modular design [PD01]",
                 )
+        else:
+            for match in _INLINE_UNDERSCORE_CMD_PATTERN.finditer(line):
+                inline_matches.append((line_num, match.group(1)))
 
-    # Also check for underscore commands in inline code
-    inline_pattern = re.compile(r"`vince\s+(\w+_\w+)`")
-    in_code_block = False
-
-    for line_num, line in enumerate(lines, 1):
-        if line.strip().startswith("```"):
-            in_code_block = not in_code_block
-            continue
-
-        if not in_code_block:
-            for match in inline_pattern.finditer(line):
-                bad_cmd = match.group(1)
-                result.add_error(
-                    filename,
-                    line_num,
-                    "10.3",
-                    f"Underscore-joined command '{bad_cmd}' in inline code violates modular design",
-                )
+    for line_num, bad_cmd in inline_matches:
+        result.add_error(
+            filename,
+            line_num,
+            "10.3",
+            f"Underscore-joined command '{bad_cmd}' in inline code violates modular design",
+        )
 
     return result
 
@@ -1050,7 +1203,6 @@ def validate_api_completeness(content: str, filename: str) -> ValidationResult:
     # Expected commands from the vince CLI
     expected_commands = {"slap", "chop", "set", "forget", "offer", "reject", "list"}
 
-    lines = content.split("\n")
     in_code_block = False
     code_block_lang = ""
 
@@ -1058,29 +1210,19 @@ def validate_api_completeness(content: str, filename: str) -> ValidationResult:
     documented_commands: dict[str, dict[str, bool]] = {}
     current_command = None
 
-    # Patterns for detecting command sections and documentation elements
-    command_section_pattern = re.compile(r"^###\s+(\w+)\s*$")
-    subsection_pattern = re.compile(r"^####\s+(.+)\s*$")
-    function_sig_pattern = re.compile(r"def\s+cmd_(\w+)\s*\(")
-    param_table_header = re.compile(r"\|\s*Parameter\s*\|")
-    return_type_pattern = re.compile(r"####\s+Return\s+Type")
-    exceptions_pattern = re.compile(r"####\s+Raised\s+Exceptions")
-
-    for line_num, line in enumerate(lines, 1):
+    # Only fences, "###" headings, signatures and parameter table headers
+    # can change anything below, so the scan yields just those lines
+    for line_num, line in _matching_lines(content, _API_LINE_PATTERN):
         stripped = line.strip()
 
         # Track code blocks
         if stripped.startswith("```"):
-            if not in_code_block:
-                in_code_block = True
-                code_block_lang = stripped[3:].strip()
-            else:
-                in_code_block = False
-                code_block_lang = ""
+            code_block_lang = "" if in_code_block else stripped[3:].strip()
+            in_code_block = not in_code_block
             continue
 
         # Check for command section headers (### slap, ### chop, etc.)
-        match = command_section_pattern.match(stripped)
+        match = _COMMAND_SECTION_PATTERN.match(stripped)
         if match:
             cmd_name = match.group(1).lower()
             if cmd_name in expected_commands:
@@ -1096,32 +1238,32 @@ def validate_api_completeness(content: str, filename: str) -> ValidationResult:
             continue
 
         # Check for subsections within a command using precise pattern matching
-        # Use return_type_pattern for more precise detection of return type sections
-        if return_type_pattern.match(stripped):
+        # Use _RETURN_TYPE_PATTERN for more precise detection of return type sections
+        if _RETURN_TYPE_PATTERN.match(stripped):
             if current_command:
                 documented_commands[current_command]["has_return_type"] = True
             continue
 
-        # Use exceptions_pattern for more precise detection of raised exceptions sections
-        if exceptions_pattern.match(stripped):
+        # Use _EXCEPTIONS_PATTERN for precise detection of raised exceptions sections
+        if _EXCEPTIONS_PATTERN.match(stripped):
             if current_command:
                 documented_commands[current_command]["has_exceptions"] = True
             continue
 
         # Check for other subsections within a command (for future extensibility)
-        subsection_match = subsection_pattern.match(stripped)
+        subsection_match = _SUBSECTION_PATTERN.match(stripped)
         if subsection_match:
             # Subsection detected but not currently used for additional tracking
             continue
 
         # Check for function signature in code blocks
         if in_code_block and code_block_lang == "python" and current_command:
-            sig_match = function_sig_pattern.search(line)
+            sig_match = _CMD_FUNCTION_PATTERN.search(line)
             if sig_match:
                 documented_commands[current_command]["has_signature"] = True
 
         # Check for parameter table
-        if current_command and param_table_header.search(line):
+        if current_command and _PARAM_TABLE_HEADER_PATTERN.search(line):
             documented_commands[current_command]["has_parameters"] = True
 
     # Validate completeness for each expected command
@@ -1174,6 +1316,36 @@ def validate_api_completeness(content: str, filename: str) -> ValidationResult:
 # =============================================================================
 
 
+def _analyze_schema_block(
+    block_text: str, schema_info: dict[str, bool], in_example_section: bool
+) -> None:
+    """Record what a JSON code block under a schema section documents."""
+    found = {
+        match.lastgroup for match in _JSON_SCHEMA_KEY_PATTERN.finditer(block_text)
+    }
+
+    # Check if it's a schema definition
+    if "schema" in found:
+        schema_info["has_schema_def"] = True
+
+        # Check for type definitions
+        if "type" in found:
+            schema_info["has_types"] = True
+
+        # Check for constraints (pattern, enum, min/max and lengths)
+        if "constraint" in found:
+            schema_info["has_constraints"] = True
+
+        # Check for required fields definition
+        if "required" in found:
+            schema_info["has_required"] = True
+
+    # Check if it's an example - use _EXAMPLE_SECTION_PATTERN context
+    # or fallback to content-based detection
+    elif in_example_section or "version" in found:
+        schema_info["has_example"] = True
+
+
 def validate_schema_completeness(content: str, filename: str) -> ValidationResult:
     """
     Validate that JSON schemas are complete with all required elements.
@@ -1192,83 +1364,47 @@ def validate_schema_completeness(content: str, filename: str) -> ValidationResul
     # Expected schemas
     expected_schemas = {"defaults", "offers", "config"}
 
-    lines = content.split("\n")
-    in_code_block = False
-    code_block_lang = ""
-    code_block_content = []
-
     # Track documented schemas
     documented_schemas: dict[str, dict[str, bool]] = {}
     current_schema = None
     in_example_section = False  # Track when parser enters example section
 
-    # Patterns
-    schema_section_pattern = re.compile(r"^##\s+(\w+)\s+Schema", re.IGNORECASE)
-    example_section_pattern = re.compile(r"^###\s+Example", re.IGNORECASE)
-
-    for line_num, line in enumerate(lines, 1):
-        stripped = line.strip()
+    # Walk "##" headings outside code blocks and closed code blocks in
+    # document order, so each block is analyzed with the schema state in
+    # effect at its closing fence
+    events = merge(
+        (
+            (block.end_line, block)
+            for block in _code_blocks(content)
+            if block.end_line is not None
+        ),
+        (
+            (line_num, stripped)
+            for line_num, _, stripped in _prose_lines(content)
+            if stripped.startswith("##")
+        ),
+        key=itemgetter(0),
+    )
 
-        # Track code blocks
-        if stripped.startswith("```"):
-            if not in_code_block:
-                in_code_block = True
-                code_block_lang = stripped[3:].strip()
-                code_block_content = []
-            else:
-                # End of code block - analyze content
-                if current_schema and code_block_lang == "json":
-                    block_text = "\n".join(code_block_content)
-
-                    # Check if it's a schema definition
-                    if '"$schema"' in block_text:
-                        documented_schemas[current_schema]["has_schema_def"] = True
-
-                        # Check for type definitions
-                        if '"type"' in block_text:
-                            documented_schemas[current_schema]["has_types"] = True
-
-                        # Check for constraints
-                        if any(
-                            c in block_text
-                            for c in [
-                                '"pattern"',
-                                '"enum"',
-                                '"minimum"',
-                                '"maximum"',
-                                '"minLength"',
-                                '"maxLength"',
-                            ]
-                        ):
-                            documented_schemas[current_schema]["has_constraints"] = True
-
-                        # Check for required fields definition
-                        if '"required"' in block_text:
-                            documented_schemas[current_schema]["has_required"] = True
-
-                    # Check if it's an example - use example_section_pattern context
-                    # or fallback to content-based detection
-                    elif in_example_section or (
-                        '"version"' in block_text and '"$schema"' not in block_text
-                    ):
-                        documented_schemas[current_schema]["has_example"] = True
-
-                in_code_block = False
-                code_block_lang = ""
+    for line_num, event in events:
+        if isinstance(event, CodeBlock):
+            if current_schema and event.lang == "json":
+                _analyze_schema_block(
+                    event.text, documented_schemas[current_schema], in_example_section
+                )
             continue
 
-        if in_code_block:
-            code_block_content.append(line)
-            continue
+        # Otherwise the event is a stripped "##" heading line
+        stripped = event
 
-        # Use example_section_pattern to detect example sections
-        if example_section_pattern.match(stripped):
+        # Use _EXAMPLE_SECTION_PATTERN to detect example sections
+        if _EXAMPLE_SECTION_PATTERN.match(stripped):
             if current_schema:
                 in_example_section = True
             continue
 
         # Check for schema section headers
-        match = schema_section_pattern.match(stripped)
+        match = _SCHEMA_SECTION_PATTERN.match(stripped)
         if match:
             schema_name = match.group(1).lower()
             if schema_name in expected_schemas:
@@ -1359,8 +1495,6 @@ def validate_error_catalog(content: str, filename: str) -> ValidationResult:
         "OS": (600, 699),
     }
 
-    lines = content.split("\n")
-    in_code_block = False
     in_table = False
     table_headers: list[str] = []
 
@@ -1368,23 +1502,10 @@ def validate_error_catalog(content: str, filename: str) -> ValidationResult:
     documented_errors: dict[str, dict] = {}
     current_category = None
 
-    # Patterns
-    error_code_pattern = re.compile(r"^VE(\d{3})$")
-    # Match category headers like "### Input Errors" or "### OS Integration Errors"
-    category_section_pattern = re.compile(r"^###\s+(\w+)(?:\s+\w+)?\s+Errors", re.IGNORECASE)
-
-    for line_num, line in enumerate(lines, 1):
-        stripped = line.strip()
-
-        if stripped.startswith("```"):
-            in_code_block = not in_code_block
-            continue
-
-        if in_code_block:
-            continue
-
+    # Code blocks are skipped by the shared line scan
+    for line_num, line, stripped in _prose_lines(content):
         # Check for category section headers
-        cat_match = category_section_pattern.match(stripped)
+        cat_match = _ERROR_CATEGORY_PATTERN.match(stripped)
         if cat_match:
             current_category = cat_match.group(1)
             in_table = False
@@ -1409,7 +1530,7 @@ def validate_error_catalog(content: str, filename: str) -> ValidationResult:
 
                     # Extract error code
                     code = row_data.get("code", "")
-                    code_match = error_code_pattern.match(code)
+                    code_match = _ERROR_CODE_PATTERN.match(code)
 
                     if code_match:
                         error_num = int(code_match.group(1))
@@ -1437,7 +1558,7 @@ def validate_error_catalog(content: str, filename: str) -> ValidationResult:
     # Validate each documented error
     for code, error_info in documented_errors.items():
         # Validate format
-        if not error_code_pattern.match(code):
+        if not _ERROR_CODE_PATTERN.match(code):
             result.add_error(
                 filename,
                 error_info["line"],
@@ -1505,8 +1626,6 @@ def validate_state_transitions(content: str, filename: str) -> ValidationResult:
     """
     result = ValidationResult()
 
-    lines = content.split("\n")
-    in_code_block = False
     in_table = False
     table_headers: list[str] = []
 
@@ -1515,31 +1634,17 @@ def validate_state_transitions(content: str, filename: str) -> ValidationResult:
     current_entity = None
     current_transition_section = None  # Track current transition section for context
 
-    # Patterns
-    transition_section_pattern = re.compile(
-        r"^###\s+(\w+)\s+State\s+Transitions", re.IGNORECASE
-    )
-    entity_section_pattern = re.compile(r"^##\s+(\w+)\s+Lifecycle", re.IGNORECASE)
-
-    for line_num, line in enumerate(lines, 1):
-        stripped = line.strip()
-
-        if stripped.startswith("```"):
-            in_code_block = not in_code_block
-            continue
-
-        if in_code_block:
-            continue
-
+    # Code blocks are skipped by the shared line scan
+    for line_num, line, stripped in _prose_lines(content):
         # Check for entity lifecycle sections
-        entity_match = entity_section_pattern.match(stripped)
+        entity_match = _ENTITY_SECTION_PATTERN.match(stripped)
         if entity_match:
             current_entity = entity_match.group(1).lower()
             current_transition_section = None  # Reset transition section
             continue
 
-        # Use transition_section_pattern to detect transition sections
-        trans_match = transition_section_pattern.match(stripped)
+        # Use _TRANSITION_SECTION_PATTERN to detect transition sections
+        trans_match = _TRANSITION_SECTION_PATTERN.match(stripped)
         if trans_match:
             current_transition_section = trans_match.group(1).lower()
             in_table = False  # Reset table state for new section
@@ -1639,13 +1744,10 @@ def validate_state_transitions(content: str, filename: str) -> ValidationResult:
 def extract_errors_from_tables(tables_content: str) -> set[str]:
     """Extract all error codes from the ERRORS table in tables.md."""
     errors = set()
-    lines = tables_content.split("\n")
     in_errors_section = False
     in_table = False
 
-    for line in lines:
-        stripped = line.strip()
-
+    for _, _, stripped, _, _ in _tokenize(tables_content):
         if stripped.startswith("## ERRORS"):
             in_errors_section = True
             continue
@@ -1668,13 +1770,10 @@ def extract_errors_from_tables(tables_content: str) -> set[str]:
 def extract_states_from_tables(tables_content: str) -> set[str]:
     """Extract all state IDs from the STATES table in tables.md."""
     states = set()
-    lines = tables_content.split("\n")
     in_states_section = False
     in_table = False
 
-    for line in lines:
-        stripped = line.strip()
-
+    for _, _, stripped, _, _ in _tokenize(tables_content):
         if stripped.startswith("## STATES"):
             in_states_section = True
             continue
@@ -1698,13 +1797,10 @@ def extract_states_from_tables(tables_content: str) -> set[str]:
 def extract_config_options_from_tables(tables_content: str) -> set[str]:
     """Extract all config option keys from the CONFIG_OPTIONS table in tables.md."""
     options = set()
-    lines = tables_content.split("\n")
     in_config_section = False
     in_table = False
 
-    for line in lines:
-        stripped = line.strip()
-
+    for _, _, stripped, _, _ in _tokenize(tables_content):
         if stripped.startswith("## CONFIG_OPTIONS"):
             in_config_section = True
             continue
@@ -1750,29 +1846,13 @@ def extract_commands_from_api(api_path: Path) -> set[str]:
         return commands
 
     content = api_path.read_text()
-    lines = content.split("\n")
-
-    # Pattern to match command section headers like ### slap, ### chop, etc.
-    # These are the main command documentation sections
-    command_section_pattern = re.compile(r"^###\s+(\w+)\s*$")
 
     # Known vince commands to filter out non-command sections
     known_commands = {"slap", "chop", "set", "forget", "offer", "reject", "list", "sync"}
 
-    in_code_block = False
-
-    for line in lines:
-        stripped = line.strip()
-
-        # Track code blocks to avoid matching headers inside them
-        if stripped.startswith("```"):
-            in_code_block = not in_code_block
-            continue
-
-        if in_code_block:
-            continue
-
-        match = command_section_pattern.match(stripped)
+    # Skip code blocks to avoid matching headers inside them
+    for _, _, stripped in _prose_lines(content):
+        match = _COMMAND_SECTION_PATTERN.match(stripped)
         if match:
             cmd_name = match.group(1).lower()
             # Only include if it's a known command (to filter out other H3 sections)
@@ -1823,8 +1903,7 @@ def extract_commands_from_source(commands_dir: Path) -> set[str]:
             # For unknown files, try to extract command from function definition
             content = py_file.read_text()
             # Look for cmd_* function definitions
-            cmd_pattern = re.compile(r"def\s+cmd_(\w+)\s*\(")
-            for match in cmd_pattern.finditer(content):
+            for match in _CMD_FUNCTION_PATTERN.finditer(content):
                 commands.add(match.group(1).lower())
 
     return commands
@@ -1901,8 +1980,7 @@ def validate_new_table_cross_references(
     table_config = extract_config_options_from_tables(tables_content)
 
     # Extract error codes from errors.md
-    error_code_pattern = re.compile(r"VE\d{3}")
-    doc_errors = set(error_code_pattern.findall(errors_content))
+    doc_errors = set(_ERROR_CODE_REF_PATTERN.findall(errors_content))
 
     # Check errors cross-reference
     for error in doc_errors:
@@ -1915,8 +1993,7 @@ def validate_new_table_cross_references(
             )
 
     # Extract state sids from states.md
-    state_sid_pattern = re.compile(r"(def-\w+|off-\w+)")
-    doc_states = set(state_sid_pattern.findall(states_content))
+    doc_states = set(_STATE_SID_PATTERN.findall(states_content))
 
     # Check states cross-reference
     for state in doc_states:
@@ -1929,10 +2006,8 @@ def validate_new_table_cross_references(
             )
 
     # Extract config keys from config.md (look for keys in tables)
-    # Only match keys at the START of table rows (first column after |)
-    config_key_pattern = re.compile(r"^\|\s*`(\w+)`\s*\|", re.MULTILINE)
     doc_config = set()
-    for match in config_key_pattern.finditer(config_content):
+    for match in _CONFIG_KEY_PATTERN.finditer(config_content):
         key = match.group(1)
         # Exclude table headers and common non-key words
         if key not in [
@@ -1971,7 +2046,7 @@ def validate_new_table_cross_references(
 
 
 def validate_file(
-    filepath: Path, tables_definitions: dict[str, set[str]] = None
+    filepath: Path, tables_definitions: dict[str, frozenset[str]] = None
 ) -> ValidationResult:
     """Validate a single documentation file."""
     result = ValidationResult()
@@ -2019,8 +2094,28 @@ def validate_file(
     return result
 
 
-def validate_all_docs(docs_dir: Path) -> ValidationResult:
-    """Validate all documentation files."""
+# Per-process validate_file arguments for validate_all_docs worker pools
+_worker_args: tuple = ()
+
+
+def _init_worker(tables_definitions: dict[str, frozenset[str]]) -> None:
+    """Receive the shared validate_file arguments once per worker process."""
+    global _worker_args
+    _worker_args = (tables_definitions,)
+
+
+def _validate_file_in_worker(filepath: Path) -> ValidationResult:
+    return validate_file(filepath, *_worker_args)
+
+
+def validate_all_docs(docs_dir: Path, jobs: int = 1) -> ValidationResult:
+    """
+    Validate all documentation files.
+
+    With jobs > 1, per-file validation runs in a pool of that many worker
+    processes. Results are merged in file order either way, so the report
+    is identical to a sequential run.
+    """
     result = ValidationResult()
 
     # First, extract definitions from tables.md (SSOT)
@@ -2053,11 +2148,36 @@ def validate_all_docs(docs_dir: Path) -> ValidationResult:
         "testing.md",
     ]
 
+    existing = [docs_dir / doc_file for doc_file in doc_files]
+    existing = [filepath for filepath in existing if filepath.exists()]
+    if jobs > 1 and len(existing) > 1:
+        # The definitions go to each worker once through the initializer
+        # rather than being pickled with every file
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_worker,
+            initargs=(tables_definitions,),
+        ) as executor:
+            file_results = dict(
+                zip(
+                    existing,
+                    executor.map(
+                        _validate_file_in_worker,
+                        existing,
+                        chunksize=max(1, len(existing) // jobs),
+                    ),
+                )
+            )
+    else:
+        file_results = {
+            filepath: validate_file(filepath, tables_definitions)
+            for filepath in existing
+        }
+
     for doc_file in doc_files:
         filepath = docs_dir / doc_file
-        if filepath.exists():
-            file_result = validate_file(filepath, tables_definitions)
-            result.merge(file_result)
+        if filepath in file_results:
+            result.merge(file_results[filepath])
         else:
             result.add_warning(
                 str(filepath), None, "FILE", f"Documentation file not found: {doc_file}"
@@ -2176,6 +2296,12 @@ def main():
         default="docs",
         help="Path to documentation directory (default: docs)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for validating all files (default: 1)",
+    )
 
     args = parser.parse_args()
     docs_dir = Path(args.docs_dir)
@@ -2200,7 +2326,7 @@ def main():
         result = validate_cross_refs_only(docs_dir)
     else:
         # Default: validate all
-        result = validate_all_docs(docs_dir)
+        result = validate_all_docs(docs_dir, jobs=args.jobs)
 
     print_report(result)
 
@@ -228,8 +228,6 @@ class WindowsHandler:
 
         # Record previous default for rollback (Requirement 9.1)
         previous = self.get_current_default(extension)
-        # Also record the previous ProgID for potential rollback
-        previous_prog_id = self._get_previous_prog_id(ext)
         prog_id = f"vince.{ext[1:]}"
 
         if dry_run:
@@ -239,6 +237,10 @@ class WindowsHandler:
                 previous_default=previous,
             )
 
+        # Also record the previous ProgID for potential rollback; a dry run
+        # never rolls back, so it skips this registry read
+        previous_prog_id = self._get_previous_prog_id(ext)
+
         prog_id_created = False
         extension_associated = False
 
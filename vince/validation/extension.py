@@ -11,8 +11,8 @@ from vince.errors import InvalidExtensionError
 # Pattern for valid extensions: dot followed by lowercase alphanumeric
 EXTENSION_PATTERN = re.compile(r"^\.[a-z0-9]+$")
 
-# Set of supported file extensions
-SUPPORTED_EXTENSIONS = {
+# Set of supported file extensions (immutable)
+SUPPORTED_EXTENSIONS = frozenset({
     ".md",
     ".py",
     ".txt",
@@ -25,6 +25,12 @@ SUPPORTED_EXTENSIONS = {
     ".xml",
     ".csv",
     ".sql",
+})
+
+# Canonical extension keyed by its common spellings (".md" and ".MD").
+# Every value already satisfies EXTENSION_PATTERN, so a hit is a full pass.
+_EXT_LOOKUP: dict[str, str] = {
+    variant: ext for ext in SUPPORTED_EXTENSIONS for variant in (ext, ext.upper())
 }
 
 
@@ -35,6 +41,9 @@ def validate_extension(ext: str) -> str:
     1. Extension matches pattern ^\.[a-z0-9]+$
     2. Extension is in the supported extensions set
 
+    Common spellings resolve with one dict lookup; other mixed-case input
+    is lowercased and checked in full.
+
     Args:
         ext: File extension to validate (e.g., ".md", ".py")
 
@@ -44,6 +53,12 @@ def validate_extension(ext: str) -> str:
     Raises:
         InvalidExtensionError: If extension is invalid or unsupported (VE102)
     """
+    # Fast path: supported extension in a known spelling
+    try:
+        return _EXT_LOOKUP[ext]
+    except KeyError:
+        pass
+
     # Normalize to lowercase
     ext = ext.lower()
 
@@ -12,8 +12,8 @@ from vince.errors import InvalidOfferIdError
 # followed by up to 31 lowercase alphanumeric, underscore, or hyphen characters
 OFFER_ID_PATTERN = re.compile(r"^[a-z][a-z0-9_-]{0,31}$")
 
-# Reserved names that cannot be used as offer IDs
-RESERVED_NAMES = {"help", "version", "list", "all", "none", "default"}
+# Reserved names that cannot be used as offer IDs (immutable)
+RESERVED_NAMES = frozenset({"help", "version", "list", "all", "none", "default"})
 
 
 def validate_offer_id(offer_id: str) -> str:
@@ -32,8 +32,8 @@ def validate_offer_id(offer_id: str) -> str:
     Raises:
         InvalidOfferIdError: If offer_id is invalid or reserved (VE103)
     """
-    # Check pattern match
-    if not OFFER_ID_PATTERN.match(offer_id):
+    # Check pattern match (fullmatch, so "$" can't accept a trailing newline)
+    if not OFFER_ID_PATTERN.fullmatch(offer_id):
         raise InvalidOfferIdError(offer_id)
 
     # Check if reserved
@@ -5,18 +5,99 @@ Validates that paths exist, are files, and are executable.
 """
 
 import os
+import stat
 from pathlib import Path
+from typing import NamedTuple
 
 from vince.errors import InvalidPathError, PermissionDeniedError
 
 
+class PathProbe(NamedTuple):
+    """File-type and mode bits gathered for a path in one probe."""
+
+    path: Path
+    is_file: bool
+    mode: int
+    uid: int
+    gid: int
+
+
+def _probe_path(path: Path) -> PathProbe:
+    """Stat a path once, following it only if it is a symlink.
+
+    Symlinked parent directories are resolved with os.path.realpath on every
+    call, so a retargeted directory link is always followed to its new target.
+
+    Args:
+        path: Path to probe
+
+    Returns:
+        PathProbe for the absolute path, or for the symlink target when
+        path is a symlink
+
+    Raises:
+        OSError: If the path (or a symlink's target) doesn't exist
+        ValueError: If the path contains a null byte
+    """
+    # abspath collapses ".." as text, which is wrong after a symlinked
+    # directory (link/.. is the link target's parent), so such paths are
+    # resolved with realpath up front
+    if os.pardir in Path(path).parts:
+        absolute = os.path.realpath(path)
+    else:
+        absolute = os.path.abspath(path)
+    st = os.lstat(absolute)
+    if stat.S_ISLNK(st.st_mode):
+        resolved_path = Path(os.path.realpath(absolute))
+        st = os.stat(resolved_path)
+    else:
+        parent, name = os.path.split(absolute)
+        resolved_path = Path(os.path.realpath(parent), name)
+    return PathProbe(
+        resolved_path,
+        stat.S_ISREG(st.st_mode),
+        st.st_mode,
+        st.st_uid,
+        st.st_gid,
+    )
+
+
+def _is_executable(probe: PathProbe) -> bool:
+    """Check execute permission from the probed mode bits.
+
+    Applies the POSIX owner/group/other precedence against the current
+    effective uid and groups. Root may execute a file when any execute bit
+    is set. Platforms without POSIX ids (Windows) fall back to os.access.
+
+    Args:
+        probe: Result of _probe_path for a regular file
+
+    Returns:
+        True if the current process may execute the file
+    """
+    if not hasattr(os, "geteuid"):
+        return os.access(probe.path, os.X_OK)
+    euid = os.geteuid()
+    if euid == 0:
+        return bool(probe.mode & 0o111)
+    if probe.uid == euid:
+        return bool(probe.mode & stat.S_IXUSR)
+    if probe.gid == os.getegid() or probe.gid in os.getgroups():
+        return bool(probe.mode & stat.S_IXGRP)
+    return bool(probe.mode & stat.S_IXOTH)
+
+
 def validate_path(path: Path) -> Path:
     """Validate application path exists and is executable.
 
     Performs three checks:
-    1. Path exists (using Path.exists())
-    2. Path is a file (using Path.is_file())
-    3. Path is executable (using os.access with X_OK)
+    1. Path exists (using a single os.lstat call)
+    2. Path is a file (using stat.S_ISREG on the same result)
+    3. Path is executable (mode bits checked against the effective uid/gids)
+
+    Only symlinks are resolved with os.path.realpath, followed by one
+    os.stat of the target. For any other path only the parent directory is
+    resolved.
 
     Args:
         path: Path to the application executable
@@ -28,19 +109,21 @@ def validate_path(path: Path) -> Path:
         InvalidPathError: If path doesn't exist or isn't a file (VE101)
         PermissionDeniedError: If path isn't executable (VE202)
     """
-    # Resolve to absolute path
-    resolved_path = path.resolve()
-
-    # Check if path exists
-    if not resolved_path.exists():
-        raise InvalidPathError(str(resolved_path))
+    # Check if path exists, resolving symlinks only when the path is one
+    try:
+        probe = _probe_path(path)
+    except OSError as e:
+        # filename is the symlink target when a link points nowhere
+        raise InvalidPathError(str(e.filename or path)) from e
+    except ValueError as e:
+        raise InvalidPathError(os.path.abspath(path)) from e
 
     # Check if path is a file (not a directory)
-    if not resolved_path.is_file():
-        raise InvalidPathError(str(resolved_path))
+    if not probe.is_file:
+        raise InvalidPathError(str(probe.path))
 
     # Check if path is executable
-    if not os.access(resolved_path, os.X_OK):
-        raise PermissionDeniedError(str(resolved_path))
+    if not _is_executable(probe):
+        raise PermissionDeniedError(str(probe.path))
 
-    return resolved_path
+    return probe.path